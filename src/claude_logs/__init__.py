@@ -5,112 +5,199 @@ Architecture:
 - Pydantic models parse JSON into typed message structures
 - Messages produce RenderBlock lists (flexible rendering primitives)
 - Formatters convert RenderBlocks to output formats (ANSI, Markdown, Plain)
+
+Public names are imported lazily on first access (PEP 562) so importing the
+package does not pull in pydantic or watchdog until they are needed.
 """
 
 from __future__ import annotations
 
-# Date parsing
-from .dateparse import parse_datetime
-
-# Grouping
-from .grouping import (
-    FileHandle,
-    compute_bucket_key,
-    parse_group_by_spec,
-    render_grouped,
-    scout_files,
-)
-
-# Block types and Style enum
-from .blocks import (
-    AnyBlock,
-    CodeBlock,
-    DividerBlock,
-    HeaderBlock,
-    KeyValueBlock,
-    ListBlock,
-    NestedBlock,
-    RenderBlock,
-    SpacerBlock,
-    Style,
-    TextBlock,
-)
-
-# Formatters
-from .formatters import (
-    ANSIFormatter,
-    Formatter,
-    MarkdownFormatter,
-    PlainFormatter,
-)
-
-# Models, TypedDicts, and parse_message
-from .models import (
-    # TypedDicts
-    CompactMetadata,
-    ContentItem,
-    ImageContentItem,
-    ImageSourceInfo,
-    TextContentItem,
-    ThinkingContentItem,
-    ToolResultContentItem,
-    ToolResultContentValue,
-    ToolResultImageItem,
-    ToolResultTextItem,
-    ToolUseContentItem,
-    UsageInfo,
-    # Content block models
-    ContentBlock,
-    ImageContent,
-    TextContent,
-    ThinkingContent,
-    ToolResultContent,
-    ToolUseContent,
-    # Message models
-    AgentStyleMessage,
-    AssistantMessage,
-    BaseMessage,
-    FileHistorySnapshot,
-    LastPromptMessage,
-    ProgressMessage,
-    QueueOperationMessage,
-    ResultMessage,
-    SummaryMessage,
-    SystemMessage,
-    SystemStyleMessage,
-    UserMessage,
-    # Discriminated union and parser
-    Message,
-    parse_message,
-    # Registry
-    get_filter_registry,
-    LAST_VERIFIED_CLAUDE_CODE_VERSION,
-    # Config
-    FilterConfig,
-    GroupByConfig,
-    RenderConfig,
-    # Constants
-    TOOL_INPUT_TRUNCATE_LENGTH,
-    TOOL_RESULT_PREVIEW_LINES,
-)
-
-# Stream processing
-from .stream import (
-    process_stream,
-    should_show_message,
-)
-
-# File watching
-from .watcher import (
-    FileWatcher,
-    WATCHDOG_AVAILABLE,
-    watch_path,
-)
-
-# Conditionally export JSONLEventHandler if watchdog is available
-if WATCHDOG_AVAILABLE:
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Date parsing
+    from .dateparse import parse_datetime
+
+    # Grouping
+    from .grouping import (
+        FileHandle,
+        compute_bucket_key,
+        parse_group_by_spec,
+        render_grouped,
+        scout_files,
+    )
+
+    # Block types and Style enum
+    from .blocks import (
+        AnyBlock,
+        CodeBlock,
+        DividerBlock,
+        HeaderBlock,
+        KeyValueBlock,
+        ListBlock,
+        NestedBlock,
+        RenderBlock,
+        SpacerBlock,
+        Style,
+        TextBlock,
+    )
+
+    # Formatters
+    from .formatters import (
+        ANSIFormatter,
+        Formatter,
+        MarkdownFormatter,
+        PlainFormatter,
+    )
+
+    # Models, TypedDicts, and parse_message
+    from .models import (
+        # TypedDicts
+        CompactMetadata,
+        ContentItem,
+        ImageContentItem,
+        ImageSourceInfo,
+        TextContentItem,
+        ThinkingContentItem,
+        ToolResultContentItem,
+        ToolResultContentValue,
+        ToolResultImageItem,
+        ToolResultTextItem,
+        ToolUseContentItem,
+        UsageInfo,
+        # Content block models
+        ContentBlock,
+        ImageContent,
+        TextContent,
+        ThinkingContent,
+        ToolResultContent,
+        ToolUseContent,
+        # Message models
+        AgentStyleMessage,
+        AssistantMessage,
+        BaseMessage,
+        FileHistorySnapshot,
+        LastPromptMessage,
+        ProgressMessage,
+        QueueOperationMessage,
+        ResultMessage,
+        SummaryMessage,
+        SystemMessage,
+        SystemStyleMessage,
+        UserMessage,
+        # Discriminated union and parser
+        Message,
+        parse_message,
+        # Registry
+        get_filter_registry,
+        LAST_VERIFIED_CLAUDE_CODE_VERSION,
+        # Config
+        FilterConfig,
+        GroupByConfig,
+        RenderConfig,
+        # Constants
+        TOOL_INPUT_TRUNCATE_LENGTH,
+        TOOL_RESULT_PREVIEW_LINES,
+    )
+
+    # Stream processing
+    from .stream import (
+        MessageFilter,
+        compile_filter,
+        process_stream,
+        should_show_message,
+    )
+
+    # File watching
+    from .watcher import (
+        FileWatcher,
+        WATCHDOG_AVAILABLE,
+        watch_path,
+    )
     from .watcher import JSONLEventHandler
 
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    # Date parsing
+    "parse_datetime": "dateparse",
+    # Grouping
+    "FileHandle": "grouping",
+    "compute_bucket_key": "grouping",
+    "parse_group_by_spec": "grouping",
+    "render_grouped": "grouping",
+    "scout_files": "grouping",
+    # Block types and Style enum
+    "AnyBlock": "blocks",
+    "CodeBlock": "blocks",
+    "DividerBlock": "blocks",
+    "HeaderBlock": "blocks",
+    "KeyValueBlock": "blocks",
+    "ListBlock": "blocks",
+    "NestedBlock": "blocks",
+    "RenderBlock": "blocks",
+    "SpacerBlock": "blocks",
+    "Style": "blocks",
+    "TextBlock": "blocks",
+    # Formatters
+    "ANSIFormatter": "formatters",
+    "Formatter": "formatters",
+    "MarkdownFormatter": "formatters",
+    "PlainFormatter": "formatters",
+    # Models, TypedDicts, and parse_message
+    "CompactMetadata": "models",
+    "ContentItem": "models",
+    "ImageContentItem": "models",
+    "ImageSourceInfo": "models",
+    "TextContentItem": "models",
+    "ThinkingContentItem": "models",
+    "ToolResultContentItem": "models",
+    "ToolResultContentValue": "models",
+    "ToolResultImageItem": "models",
+    "ToolResultTextItem": "models",
+    "ToolUseContentItem": "models",
+    "UsageInfo": "models",
+    "ContentBlock": "models",
+    "ImageContent": "models",
+    "TextContent": "models",
+    "ThinkingContent": "models",
+    "ToolResultContent": "models",
+    "ToolUseContent": "models",
+    "AgentStyleMessage": "models",
+    "AssistantMessage": "models",
+    "BaseMessage": "models",
+    "FileHistorySnapshot": "models",
+    "LastPromptMessage": "models",
+    "ProgressMessage": "models",
+    "QueueOperationMessage": "models",
+    "ResultMessage": "models",
+    "SummaryMessage": "models",
+    "SystemMessage": "models",
+    "SystemStyleMessage": "models",
+    "UserMessage": "models",
+    "Message": "models",
+    "parse_message": "models",
+    "get_filter_registry": "models",
+    "LAST_VERIFIED_CLAUDE_CODE_VERSION": "models",
+    "FilterConfig": "models",
+    "GroupByConfig": "models",
+    "RenderConfig": "models",
+    "TOOL_INPUT_TRUNCATE_LENGTH": "models",
+    "TOOL_RESULT_PREVIEW_LINES": "models",
+    # Stream processing
+    "MessageFilter": "stream",
+    "compile_filter": "stream",
+    "process_stream": "stream",
+    "should_show_message": "stream",
+    # File watching
+    "FileWatcher": "watcher",
+    "WATCHDOG_AVAILABLE": "watcher",
+    "watch_path": "watcher",
+    # Only defined when watchdog is installed
+    "JSONLEventHandler": "watcher",
+}
+
 __all__ = [
     # Date parsing
     "parse_datetime",
@@ -181,6 +268,8 @@ __all__ = [
     "TOOL_INPUT_TRUNCATE_LENGTH",
     "TOOL_RESULT_PREVIEW_LINES",
     # Stream processing
+    "MessageFilter",
+    "compile_filter",
     "process_stream",
     "should_show_message",
     # Watcher
@@ -188,3 +277,16 @@ __all__ = [
     "WATCHDOG_AVAILABLE",
     "watch_path",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
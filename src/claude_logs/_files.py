@@ -0,0 +1,34 @@
+"""Filesystem helpers shared by the CLI and the file watcher."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+
+def iter_jsonl(root: Path) -> Iterator[tuple[Path, float]]:
+    """Yield (path, mtime) for every .jsonl file under root.
+
+    Walks with os.scandir so directory entries come with cached type info
+    and mtimes are read via DirEntry.stat(), avoiding pathlib's per-file
+    overhead. Order matches Path.rglob (pre-order, scandir order), and
+    symlinked directories are not descended into.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs: list[str] = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(".jsonl") and entry.is_file():
+                    yield Path(entry.path), entry.stat().st_mtime
+            except OSError:
+                continue  # Vanished or dangling symlink
+        stack.extend(reversed(subdirs))
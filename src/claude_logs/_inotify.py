@@ -0,0 +1,172 @@
+"""Minimal Linux inotify backend for watch_path.
+
+Talks to the kernel through ctypes and epoll so --watch works on Linux
+without watchdog and without a dispatcher thread: one read() drains every
+queued event for all watched directories.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# Event masks from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = IN_MODIFY | IN_MOVED_TO | IN_CREATE | IN_MOVE_SELF
+
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+_libc = _load_libc()
+INOTIFY_AVAILABLE = _libc is not None
+
+
+class Inotify:
+    """File/directory watcher yielding ``(path, mask)`` for created/modified entries."""
+
+    def __init__(self) -> None:
+        if _libc is None:
+            raise OSError("inotify is not available on this platform")
+        fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self.fd = fd
+        # wd -> (path, recursive, names); names limits events to those entries
+        self._dirs: dict[int, tuple[str, bool, frozenset[str] | None]] = {}
+        self._epoll = select.epoll()
+        self._epoll.register(fd, select.EPOLLIN)
+
+    @property
+    def watching(self) -> bool:
+        """Whether any watch is still active (False once every target is gone)."""
+        return bool(self._dirs)
+
+    def add_watch(self, path: str, recursive: bool = True) -> None:
+        """Watch a file, or a directory and (if recursive) every directory below it.
+
+        A file is watched through its parent directory, limited to its name,
+        so it is still followed after being deleted and recreated or replaced
+        by a rename.
+        """
+        if not os.path.isdir(path):
+            parent, name = os.path.split(path)
+            self._add_watch(parent or os.curdir, False, frozenset((name,)))
+            return
+        self._add_watch(path, recursive, None)
+        if recursive:
+            try:
+                with os.scandir(path) as it:
+                    subdirs = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+            except OSError:
+                return
+            for subdir in subdirs:
+                try:
+                    self.add_watch(subdir, recursive)
+                except OSError:
+                    pass  # Vanished or unreadable; keep watching the rest
+
+    def _add_watch(
+        self, path: str, recursive: bool, names: frozenset[str] | None
+    ) -> None:
+        assert _libc is not None
+        wd = _libc.inotify_add_watch(self.fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+        if wd in self._dirs:
+            # Same directory watched twice (e.g. two files in it); widen the filter
+            _, was_recursive, old_names = self._dirs[wd]
+            recursive = recursive or was_recursive
+            names = None if names is None or old_names is None else names | old_names
+        self._dirs[wd] = (path, recursive, names)
+
+    def read_events(self, timeout: float | None = None) -> list[tuple[str, int]]:
+        """Wait up to ``timeout`` seconds and return all queued events."""
+        if not self._epoll.poll(-1 if timeout is None else timeout):
+            return []
+
+        events: list[tuple[str, int]] = []
+        while True:
+            try:
+                data = os.read(self.fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                    continue
+                if mask & IN_Q_OVERFLOW or wd not in self._dirs:
+                    continue
+                if mask & IN_MOVE_SELF:
+                    # The watch follows the inode, so every later path would
+                    # be stale; drop it and let the IN_IGNORED that follows
+                    # remove it from _dirs
+                    assert _libc is not None
+                    _libc.inotify_rm_watch(self.fd, wd)
+                    continue
+
+                parent, recursive, names = self._dirs[wd]
+                entry = os.fsdecode(name)
+                if names is not None and entry not in names:
+                    continue
+                path = os.path.join(parent, entry)
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO) and recursive:
+                        try:
+                            self.add_watch(path, recursive)
+                        except OSError:
+                            pass
+                    continue
+                events.append((path, mask))
+        return events
+
+    def close(self) -> None:
+        self._epoll.close()
+        os.close(self.fd)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
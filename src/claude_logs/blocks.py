@@ -6,41 +6,62 @@ as rendering primitives throughout the library.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntFlag, auto
+from functools import reduce
+from operator import or_
 
 
-class Style(Enum):
-    """Style hints for rendering."""
+class Style(IntFlag):
+    """Style hints for rendering.
+
+    Styles are bit flags, so combinations are a single value
+    (``Style.BOLD | Style.INFO``) and membership is a bitwise test.
+    """
 
     # Text styles
-    BOLD = "bold"
-    DIM = "dim"
-    ITALIC = "italic"
+    BOLD = auto()
+    DIM = auto()
+    ITALIC = auto()
 
     # Semantic styles
-    ERROR = "error"
-    SUCCESS = "success"
-    WARNING = "warning"
-    INFO = "info"
+    ERROR = auto()
+    SUCCESS = auto()
+    WARNING = auto()
+    INFO = auto()
 
     # Role styles
-    USER = "user"
-    ASSISTANT = "assistant"
-    SYSTEM = "system"
-    TOOL = "tool"
-    THINKING = "thinking"
-    METADATA = "metadata"
+    USER = auto()
+    ASSISTANT = auto()
+    SYSTEM = auto()
+    TOOL = auto()
+    THINKING = auto()
+    METADATA = auto()
+
 
+# Default for RenderBlock.styles: no style flags set
+_NO_STYLE = Style(0)
 
-@dataclass
+
+@dataclass(slots=True)
 class RenderBlock:
     """Base class for rendering primitives."""
 
-    styles: set[Style] = field(default_factory=set)
+    styles: Style = _NO_STYLE
+
+    def __post_init__(self) -> None:
+        # Also accept an iterable of styles, e.g. {Style.BOLD, Style.INFO}
+        if not isinstance(self.styles, Style):
+            self.styles = _combine_styles(self.styles)
 
 
-@dataclass
+def _combine_styles(styles: Iterable[Style]) -> Style:
+    """OR an iterable of styles into a single Style flag."""
+    return reduce(or_, styles, _NO_STYLE)
+
+
+@dataclass(slots=True)
 class HeaderBlock(RenderBlock):
     """A header/title block."""
 
@@ -51,15 +72,15 @@ class HeaderBlock(RenderBlock):
     suffix: str = ""  # Optional suffix text, styled independently (e.g., timestamp)
 
 
-@dataclass
+@dataclass(slots=True)
 class TextBlock(RenderBlock):
     """Plain text content."""
 
-    text: str = ""
+    text: str = ""  # May span lines; formatters indent and style each line
     indent: int = 0  # Indentation level
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeBlock(RenderBlock):
     """Code or preformatted content."""
 
@@ -68,7 +89,7 @@ class CodeBlock(RenderBlock):
     indent: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyValueBlock(RenderBlock):
     """Key-value pair."""
 
@@ -77,7 +98,7 @@ class KeyValueBlock(RenderBlock):
     indent: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DividerBlock(RenderBlock):
     """Visual separator."""
 
@@ -85,7 +106,7 @@ class DividerBlock(RenderBlock):
     width: int = 40
 
 
-@dataclass
+@dataclass(slots=True)
 class ListBlock(RenderBlock):
     """A list of items."""
 
@@ -94,7 +115,7 @@ class ListBlock(RenderBlock):
     bullet: str = "*"
 
 
-@dataclass
+@dataclass(slots=True)
 class NestedBlock(RenderBlock):
     """Container for nested blocks."""
 
@@ -102,7 +123,7 @@ class NestedBlock(RenderBlock):
     indent: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class SpacerBlock(RenderBlock):
     """Vertical space."""
 
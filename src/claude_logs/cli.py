@@ -8,22 +8,24 @@ import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TextIO
-
-from . import (
-    ANSIFormatter,
-    Formatter,
-    MarkdownFormatter,
-    PlainFormatter,
-    RenderConfig,
-    process_stream,
-    watch_path,
-)
+from typing import TYPE_CHECKING, TextIO
+
+from ._files import iter_jsonl
 from .blocks import DividerBlock, HeaderBlock, Style
 from .dateparse import parse_datetime
-from .grouping import parse_group_by_spec, render_grouped, scout_files
-from .models import parse_message
-from .stream import should_show_message
+from .formatters import ANSIFormatter, Formatter, MarkdownFormatter, PlainFormatter
+
+# models, stream and grouping pull in pydantic; they are imported inside the
+# commands that need them so --help and --version start quickly
+if TYPE_CHECKING:
+    from .models import FilterConfig, RenderConfig
+
+
+# Byte translation table for the all-ASCII fast path in encode_path:
+# [a-zA-Z0-9-] map to themselves, every other byte maps to "-"
+_ASCII_ENCODE_TABLE = bytes(
+    c if c < 0x80 and (chr(c).isalnum() or c == 0x2D) else 0x2D for c in range(256)
+)
 
 
 def encode_path(path: str) -> str:
@@ -38,15 +40,20 @@ def encode_path(path: str) -> str:
       - BMP chars (U+0000-U+FFFF, 1-3 bytes) -> 1 dash each
       - SMP chars (U+10000+, 4 bytes) -> 2 dashes each
     """
+    if path.isascii():
+        # Common case: one C-level translate over the whole path
+        return path.encode("ascii").translate(_ASCII_ENCODE_TABLE).decode("ascii")
+
     result = []
     for char in path:
         if char.isalnum() or char == "-":
             result.append(char)
+        elif char >= "\U00010000":
+            # 4 UTF-8 bytes -> floor(4/2) dashes
+            result.append("--")
         else:
-            # Calculate dashes: max(1, floor(bytes/2))
-            byte_len = len(char.encode("utf-8"))
-            dashes = max(1, byte_len // 2)
-            result.append("-" * dashes)
+            # 1-3 UTF-8 bytes -> max(1, floor(bytes/2)) == 1 dash
+            result.append("-")
     return "".join(result)
 
 
@@ -89,18 +96,37 @@ def find_session_file(
         return None
 
     if latest:
-        jsonl_files = list(projects_dir.rglob("*.jsonl"))
-        if not jsonl_files:
-            return None
-        return max(jsonl_files, key=lambda p: p.stat().st_mtime)
+        newest = max(iter_jsonl(projects_dir), key=lambda item: item[1], default=None)
+        return newest[0] if newest else None
 
     if session_id:
-        matches = list(projects_dir.rglob(f"{session_id}.jsonl"))
-        return matches[0] if matches else None
+        filename = f"{session_id}.jsonl"
+        for path, _mtime in iter_jsonl(projects_dir):
+            if path.name == filename:
+                return path
+        return None
 
     return None
 
 
+# --find scans files as raw bytes in chunks of this size
+_FIND_CHUNK_SIZE = 256 * 1024
+
+
+def _file_contains(path: Path, needle: bytes) -> bool:
+    """Whether a file's raw bytes contain needle, reading in fixed-size chunks."""
+    overlap = len(needle) - 1
+    carry = b""
+    with open(path, "rb") as f:
+        while chunk := f.read(_FIND_CHUNK_SIZE):
+            data = carry + chunk if carry else chunk
+            if needle in data:
+                return True
+            # Keep enough of the tail to catch a match spanning two chunks
+            carry = data[-overlap:] if overlap else b""
+    return False
+
+
 def _find_matching_files(
     jsonl_files: list[Path],
     search_text: str,
@@ -111,24 +137,28 @@ def _find_matching_files(
     Each line must satisfy BOTH the text match AND time range (if set)
     for a file to be considered matching.
     """
+    from .stream import decode_line
+
     has_time_filter = config.before is not None or config.after is not None
     matching: list[Path] = []
+    # Match on raw bytes so files are never decoded just to be searched
+    needle = search_text.encode("utf-8")
 
     for jf in jsonl_files:
         try:
-            with open(jf) as f:
+            if not has_time_filter:
+                if _file_contains(jf, needle):
+                    matching.append(jf)
+                continue
+
+            with open(jf, "rb") as f:
                 for line in f:
-                    if search_text not in line:
+                    if needle not in line:
                         continue
 
-                    # Text matched -- check time filter if present
-                    if not has_time_filter:
-                        matching.append(jf)
-                        break  # Early termination
-
                     # Parse timestamp from matching line
                     try:
-                        data = _json.loads(line)
+                        data = decode_line(line)
                         ts_str = data.get("timestamp", "")
                         if not ts_str:
                             continue  # No timestamp on this line, keep looking
@@ -151,6 +181,28 @@ def _find_matching_files(
     return matching
 
 
+class _VersionCCAction(argparse.Action):
+    """Print the Claude Code version the models were verified against.
+
+    Like action="version", but models is only imported when the flag is used.
+    """
+
+    def __init__(self, option_strings: list[str], dest: str, **kwargs) -> None:
+        super().__init__(
+            option_strings,
+            dest=argparse.SUPPRESS,
+            default=argparse.SUPPRESS,
+            nargs=0,
+            help="show program's version number and exit",
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:
+        from .models import LAST_VERIFIED_CLAUDE_CODE_VERSION
+
+        print(f"Last verified against Claude Code {LAST_VERIFIED_CLAUDE_CODE_VERSION}")
+        parser.exit()
+
+
 def parse_args():
     """Parse command line arguments using subcommands.
 
@@ -273,8 +325,6 @@ Examples:
     # Version flags (on the main parser, before subcommands)
     from importlib.metadata import version as pkg_version
 
-    from .models import LAST_VERIFIED_CLAUDE_CODE_VERSION
-
     try:
         claugs_version = pkg_version("claugs")
     except Exception:
@@ -285,11 +335,7 @@ Examples:
         action="version",
         version=f"claugs {claugs_version}",
     )
-    parser.add_argument(
-        "--version-cc",
-        action="version",
-        version=f"Last verified against Claude Code {LAST_VERIFIED_CLAUDE_CODE_VERSION}",
-    )
+    parser.add_argument("--version-cc", action=_VersionCCAction)
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -358,7 +404,7 @@ Examples:
     return parser, args
 
 
-def _build_filters(args: argparse.Namespace) -> "FilterConfig":
+def _build_filters(args: argparse.Namespace) -> FilterConfig:
     """Build a FilterConfig from parsed arguments."""
     from .models import FilterConfig
 
@@ -402,6 +448,8 @@ def _build_filters(args: argparse.Namespace) -> "FilterConfig":
 
 def _build_config(args: argparse.Namespace) -> RenderConfig:
     """Build a RenderConfig from parsed arguments."""
+    from .models import RenderConfig
+
     filters = _build_filters(args)
     config = RenderConfig(filters=filters)
     if args.timestamp_format is not None:
@@ -473,11 +521,8 @@ def _build_formatter(args: argparse.Namespace) -> Formatter:
 
 def _collect_jsonl_files(directory: Path) -> list[Path]:
     """Collect JSONL files from a directory, sorted by mtime (newest first)."""
-    return sorted(
-        directory.rglob("*.jsonl"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
+    files = sorted(iter_jsonl(directory), key=lambda item: item[1], reverse=True)
+    return [path for path, _mtime in files]
 
 
 def _render_files(
@@ -488,10 +533,15 @@ def _render_files(
     group_config=None,
 ) -> None:
     """Render multiple JSONL files, with optional grouping."""
+    from .grouping import render_grouped, scout_files
+    from .models import parse_message
+    from .stream import compile_filter, decode_line, process_stream
+
     if group_config:
         handles = scout_files(files, config, tail_lines=tail_lines)
         render_grouped(handles, config, group_config, formatter)
     else:
+        msg_filter = compile_filter(config)
         for jf in files:
             has_output = False
             with open(jf) as f:
@@ -500,9 +550,11 @@ def _render_files(
                     if not line_stripped:
                         continue
                     try:
-                        data = _json.loads(line_stripped)
+                        data = decode_line(line_stripped)
+                        if not msg_filter.show_data(data):
+                            continue
                         msg = parse_message(data)
-                        if should_show_message(msg, data, config):
+                        if msg_filter.show_parsed(msg):
                             has_output = True
                             break
                     except _json.JSONDecodeError:
@@ -518,7 +570,7 @@ def _render_files(
                                     text=str(jf),
                                     icon="\U0001f4c4",
                                     level=2,
-                                    styles={Style.INFO},
+                                    styles=Style.INFO,
                                 ),
                             ]
                         )
@@ -531,6 +583,8 @@ def handle_show(
     args: argparse.Namespace, config: RenderConfig, formatter: Formatter
 ) -> int:
     """Handle the 'show' subcommand."""
+    from .grouping import parse_group_by_spec
+    from .stream import process_stream
 
     if getattr(args, "list_filters", False):
         _print_filter_list()
@@ -642,6 +696,9 @@ def handle_watch(
     args: argparse.Namespace, config: RenderConfig, formatter: Formatter
 ) -> int:
     """Handle the 'watch' subcommand."""
+    # Deferred so other subcommands never load watchdog
+    from .watcher import watch_path
+
     resolved_paths: list[Path] = []
 
     for path in args.paths:
@@ -7,7 +7,7 @@ ANSI terminal colors, Markdown, and plain text output.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
 
 from .blocks import (
     CodeBlock,
@@ -22,40 +22,75 @@ from .blocks import (
     TextBlock,
 )
 
+# level -> (indent prefix, newline + indent prefix); only a few levels occur
+_INDENT_PREFIXES: dict[int, tuple[str, str]] = {}
+
 
 class Formatter(ABC):
     """Base class for output formatters."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Map each block type to its handler's name once per class; handlers
+        # are looked up on the instance, so subclass overrides are honoured
+        cls._handler_names = {
+            block_type: handler.__name__
+            for block_type, handler in cls._block_handlers.items()
+        }
+
     def _indent(self, text: str, level: int) -> str:
         """Add indentation to text."""
         if level <= 0:
             return text
-        prefix = "  " * level
-        return "\n".join(prefix + line for line in text.split("\n"))
+        prefixes = _INDENT_PREFIXES.get(level)
+        if prefixes is None:
+            prefix = "  " * level
+            prefixes = _INDENT_PREFIXES[level] = (prefix, "\n" + prefix)
+        # Prefix the first line, then every line after a newline
+        if "\n" not in text:
+            return prefixes[0] + text
+        return prefixes[0] + text.replace("\n", prefixes[1])
 
     def format(self, blocks: list[RenderBlock]) -> str:
         """Convert render blocks to formatted string."""
-        lines: list[str] = []
+        out: list[str] = []
+        self._emit(blocks, 0, out)
+        return "\n".join(out)
+
+    def _emit(self, blocks: list[RenderBlock], indent: int, out: list[str]) -> None:
+        """Append formatted blocks to out, indented by an inherited level.
+
+        Nested children are emitted straight into the same list, so the
+        whole tree is joined exactly once by format().
+        """
+        handler_names = self._handler_names
         for block in blocks:
-            formatted = self.format_block(block)
-            if formatted:
-                lines.append(formatted)
-        return "\n".join(lines)
+            if isinstance(block, NestedBlock):
+                self._emit(block.children, indent + block.indent, out)
+                continue
+            name = handler_names.get(type(block))
+            if name is not None:
+                formatted = getattr(self, name)(block)
+                if formatted:
+                    out.append(self._indent(formatted, indent) if indent else formatted)
 
     def format_block(self, block: RenderBlock) -> str:
         """Format a single block using type dispatch."""
-        handler = self._block_handlers.get(type(block))
-        if handler:
-            return handler(self, block)
+        name = self._handler_names.get(type(block))
+        if name is not None:
+            return getattr(self, name)(block)
         return ""
 
     # Subclasses populate this with {BlockType: handler_method}
     _block_handlers: dict[type, Any] = {}
+    # Derived from _block_handlers by __init_subclass__: {BlockType: method name}
+    _handler_names: ClassVar[dict[type, str]] = {}
 
     # Common handlers that can be shared
     def _format_nested(self, block: NestedBlock) -> str:
-        inner = self.format(block.children)
-        return self._indent(inner, block.indent)
+        out: list[str] = []
+        self._emit(block.children, block.indent, out)
+        return "\n".join(out)
 
     def _format_spacer(self, block: SpacerBlock) -> str:
         return "\n" * (block.lines - 1)  # -1 because join adds one
@@ -77,6 +112,10 @@ class ANSIFormatter(Formatter):
     MAGENTA = "\033[35m"
     CYAN = "\033[36m"
 
+    # Fixed pieces for the always-BOLD key and always-DIM header suffix
+    _KV_SEP = f":{RESET} "
+    _SUFFIX_OPEN = f"{DIM} "
+
     STYLE_MAP: dict[Style, str] = {
         Style.BOLD: BOLD,
         Style.DIM: DIM,
@@ -93,12 +132,25 @@ class ANSIFormatter(Formatter):
         Style.METADATA: DIM,
     }
 
-    def _apply_styles(self, text: str, styles: set[Style]) -> str:
+    # Concatenated ANSI prefix per style combination ("" if none apply); kept
+    # per class because it is derived from that class's STYLE_MAP
+    _style_cache: ClassVar[dict[Style, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._style_cache = {}
+
+    def _apply_styles(self, text: str, styles: Style) -> str:
         """Wrap text with ANSI codes for given styles."""
         if not styles:
             return text
 
-        codes = "".join(self.STYLE_MAP.get(s, "") for s in styles)
+        codes = self._style_cache.get(styles)
+        if codes is None:
+            codes = "".join(
+                code for style, code in self.STYLE_MAP.items() if style & styles
+            )
+            self._style_cache[styles] = codes
         if codes:
             return f"{codes}{text}{self.RESET}"
         return text
@@ -111,13 +163,19 @@ class ANSIFormatter(Formatter):
             parts.append(block.prefix)
         parts.append(block.text)
         text = " ".join(parts)
-        text = self._apply_styles(text, block.styles | {Style.BOLD})
+        text = self._apply_styles(text, block.styles | Style.BOLD)
         if block.suffix:
-            text += self._apply_styles(f" {block.suffix}", {Style.DIM})
+            text = f"{text}{self._SUFFIX_OPEN}{block.suffix}{self.RESET}"
         return text
 
     def _format_text(self, block: TextBlock) -> str:
-        styled = self._apply_styles(block.text, block.styles)
+        text = block.text
+        styled = self._apply_styles(text, block.styles)
+        if block.styles and "\n" in text:
+            # Re-open the styles on every line so each line stands alone
+            codes = self._style_cache.get(block.styles, "")
+            if codes:
+                styled = styled.replace("\n", f"{self.RESET}\n{codes}")
         return self._indent(styled, block.indent)
 
     def _format_code(self, block: CodeBlock) -> str:
@@ -125,9 +183,10 @@ class ANSIFormatter(Formatter):
         return self._indent(styled, block.indent)
 
     def _format_keyvalue(self, block: KeyValueBlock) -> str:
-        key_styled = self._apply_styles(f"{block.key}:", {Style.BOLD})
         value_styled = self._apply_styles(block.value, block.styles)
-        return self._indent(f"{key_styled} {value_styled}", block.indent)
+        return self._indent(
+            f"{self.BOLD}{block.key}{self._KV_SEP}{value_styled}", block.indent
+        )
 
     def _format_divider(self, block: DividerBlock) -> str:
         line = block.char * block.width
@@ -154,11 +213,11 @@ class ANSIFormatter(Formatter):
 class MarkdownFormatter(Formatter):
     """Format output as Markdown."""
 
-    def _apply_styles(self, text: str, styles: set[Style]) -> str:
+    def _apply_styles(self, text: str, styles: Style) -> str:
         """Apply markdown formatting for styles."""
-        if Style.BOLD in styles:
+        if styles & Style.BOLD:
             text = f"**{text}**"
-        if Style.ITALIC in styles or Style.THINKING in styles:
+        if styles & (Style.ITALIC | Style.THINKING):
             text = f"*{text}*"
         # DIM and colors don't have direct markdown equivalents
         return text
@@ -180,7 +239,14 @@ class MarkdownFormatter(Formatter):
         return text
 
     def _format_text(self, block: TextBlock) -> str:
-        styled = self._apply_styles(block.text, block.styles)
+        text = block.text
+        if block.styles and "\n" in text:
+            # Emphasis markers do not span lines; apply them per line
+            styled = "\n".join(
+                self._apply_styles(line, block.styles) for line in text.split("\n")
+            )
+        else:
+            styled = self._apply_styles(text, block.styles)
         return self._indent(styled, block.indent)
 
     def _format_code(self, block: CodeBlock) -> str:
@@ -17,7 +17,7 @@ from typing import TextIO
 from .blocks import DividerBlock, HeaderBlock, Style
 from .formatters import Formatter
 from .models import GroupByConfig, RenderConfig
-from .stream import process_stream, should_show_message
+from .stream import compile_filter, decode_line, process_stream
 
 
 def parse_group_by_spec(spec: str) -> GroupByConfig:
@@ -160,7 +160,7 @@ def _scout_single_file(
                 if not line:
                     continue
                 try:
-                    data = json.loads(line)
+                    data = decode_line(line)
                     ts = _parse_timestamp(data.get("timestamp", ""))
                     if ts is None:
                         continue
@@ -258,7 +258,7 @@ def _render_sequential(
                             text=str(handle.path),
                             icon="📄",
                             level=2,
-                            styles={Style.INFO},
+                            styles=Style.INFO,
                         ),
                     ]
                 )
@@ -285,7 +285,7 @@ def _render_project_grouped(
                         text=f"Project: {project}",
                         icon="──",
                         level=2,
-                        styles={Style.SYSTEM},
+                        styles=Style.SYSTEM,
                     ),
                 ]
             )
@@ -299,7 +299,7 @@ def _render_project_grouped(
                             text=str(handle.path),
                             icon="📄",
                             level=2,
-                            styles={Style.INFO},
+                            styles=Style.INFO,
                         ),
                     ]
                 )
@@ -334,7 +334,7 @@ def _render_time_interleaved(
                             text=f"Project: {project}",
                             icon="──",
                             level=2,
-                            styles={Style.SYSTEM},
+                            styles=Style.SYSTEM,
                         ),
                     ]
                 )
@@ -384,7 +384,7 @@ def _peek_next(
             continue
 
         try:
-            data = json.loads(line)
+            data = decode_line(line)
         except json.JSONDecodeError:
             continue
 
@@ -448,6 +448,8 @@ def _interleave_by_time(
         except (IOError, OSError) as e:
             print(f"warning: cannot read {handle.path}: {e}", file=sys.stderr)
 
+    msg_filter = compile_filter(config)
+    show_data = msg_filter.show_data
     try:
         while active:
             # Find the lowest bucket key
@@ -487,7 +489,7 @@ def _interleave_by_time(
                                 text=str(of.handle.path),
                                 icon="📄",
                                 level=2,
-                                styles={Style.INFO},
+                                styles=Style.INFO,
                                 suffix=f"[{min_bucket}]",
                             ),
                         ]
@@ -498,9 +500,9 @@ def _interleave_by_time(
                 while not of.exhausted and (
                     of.current_bucket == min_bucket or of.current_bucket is None
                 ):
-                    if of.peeked_data is not None:
+                    if of.peeked_data is not None and show_data(of.peeked_data):
                         msg = parse_message(of.peeked_data)
-                        if should_show_message(msg, of.peeked_data, config):
+                        if msg_filter.show_parsed(msg):
                             blocks = msg.render(config)
                             output = formatter.format(blocks)
                             print(output)
@@ -531,10 +533,11 @@ def _render_of_remaining(
     """Render all remaining messages from an open file."""
     from .models import parse_message
 
+    msg_filter = compile_filter(config)
     while not of.exhausted:
-        if of.peeked_data is not None:
+        if of.peeked_data is not None and msg_filter.show_data(of.peeked_data):
             msg = parse_message(of.peeked_data)
-            if should_show_message(msg, of.peeked_data, config):
+            if msg_filter.show_parsed(msg):
                 blocks = msg.render(config)
                 output = formatter.format(blocks)
                 print(output)
@@ -6,11 +6,12 @@ and the parse_message function for parsing JSON data into message objects.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime as _datetime
-from typing import Annotated, Any, ClassVar, Literal, Union
+from typing import Annotated, Any, ClassVar, Literal, Union, get_args
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from typing_extensions import TypedDict
 
 from .blocks import (
@@ -32,6 +33,10 @@ TOOL_RESULT_PREVIEW_LINES = 20
 TOOL_INPUT_TRUNCATE_LENGTH = 200
 LAST_VERIFIED_CLAUDE_CODE_VERSION = "2.1.77"
 
+# Tags wrapping a local slash command's name and arguments
+_COMMAND_NAME_RE = re.compile(r"<command-name>(.*?)</command-name>", re.DOTALL)
+_COMMAND_ARGS_RE = re.compile(r"<command-args>(.*?)</command-args>", re.DOTALL)
+
 
 # =============================================================================
 # TypedDicts for Known Structures
@@ -191,7 +196,7 @@ class GroupByConfig:
     project_first: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderConfig:
     """Configuration for rendering messages."""
 
@@ -210,13 +215,28 @@ class RenderConfig:
     group_by: GroupByConfig | None = None
 
 
+def _preview_lines(text: str) -> tuple[str, int]:
+    """Return the first TOOL_RESULT_PREVIEW_LINES lines of text and its line count."""
+    total = text.count("\n") + 1
+    if total <= TOOL_RESULT_PREVIEW_LINES:
+        return text, total
+    end = -1
+    for _ in range(TOOL_RESULT_PREVIEW_LINES):
+        end = text.index("\n", end + 1)
+    return text[:end], total
+
+
 # =============================================================================
 # Content Block Models (nested within messages)
 # =============================================================================
 
 
 class ContentBlock(BaseModel):
-    """Base for content blocks within messages."""
+    """Base for content blocks within messages.
+
+    Messages render their raw content items through ``render_item`` so the
+    hot path never validates content; instances delegate to it as well.
+    """
 
     type: str
 
@@ -227,6 +247,13 @@ class ContentBlock(BaseModel):
 
     def render(self, config: RenderConfig) -> list[RenderBlock]:
         """Render this content block."""
+        return self.render_item(self.model_dump(), config)
+
+    @classmethod
+    def render_item(
+        cls, item: dict[str, Any], config: RenderConfig
+    ) -> list[RenderBlock]:
+        """Render a raw content item of this block's type."""
         return []
 
 
@@ -236,11 +263,11 @@ class TextContent(ContentBlock):
     type: Literal["text"] = "text"
     text: str = ""
 
-    def render(self, config: RenderConfig) -> list[RenderBlock]:
-        blocks: list[RenderBlock] = []
-        for line in self.text.split("\n"):
-            blocks.append(TextBlock(text=line, indent=1))
-        return blocks
+    @classmethod
+    def render_item(
+        cls, item: dict[str, Any], config: RenderConfig
+    ) -> list[RenderBlock]:
+        return [TextBlock(text=item.get("text") or "", indent=1)]
 
 
 class ThinkingContent(ContentBlock):
@@ -253,14 +280,18 @@ class ThinkingContent(ContentBlock):
     _filter_name: ClassVar[str] = "thinking"
     _filter_description: ClassVar[str] = "Thinking/reasoning blocks"
 
-    def render(self, config: RenderConfig) -> list[RenderBlock]:
+    @classmethod
+    def render_item(
+        cls, item: dict[str, Any], config: RenderConfig
+    ) -> list[RenderBlock]:
         if not config.filters.is_visible("thinking"):
             return []
 
         blocks: list[RenderBlock] = []
-        blocks.append(TextBlock(text="💭 Thinking:", indent=1, styles={Style.THINKING}))
-        for line in self.thinking.split("\n"):
-            blocks.append(TextBlock(text=line, indent=2, styles={Style.THINKING}))
+        blocks.append(TextBlock(text="💭 Thinking:", indent=1, styles=Style.THINKING))
+        blocks.append(
+            TextBlock(text=item.get("thinking") or "", indent=2, styles=Style.THINKING)
+        )
         return blocks
 
 
@@ -275,7 +306,10 @@ class ToolUseContent(ContentBlock):
     _filter_name: ClassVar[str] = "tools"
     _filter_description: ClassVar[str] = "Tool invocations and results"
 
-    def render(self, config: RenderConfig) -> list[RenderBlock]:
+    @classmethod
+    def render_item(
+        cls, item: dict[str, Any], config: RenderConfig
+    ) -> list[RenderBlock]:
         if not config.filters.is_visible("tools"):
             return []
 
@@ -284,13 +318,18 @@ class ToolUseContent(ContentBlock):
         # Tool header
         blocks.append(
             HeaderBlock(
-                text=f"Tool: {self.name}", icon="▸", level=3, styles={Style.TOOL}
+                text=f"Tool: {item.get('name', '')}",
+                icon="▸",
+                level=3,
+                styles=Style.TOOL,
             )
         )
-        blocks.append(TextBlock(text=f"({self.id})", indent=1, styles={Style.METADATA}))
+        blocks.append(
+            TextBlock(text=f"({item.get('id', '')})", indent=1, styles=Style.METADATA)
+        )
 
         # Tool inputs
-        for key, value in self.input.items():
+        for key, value in (item.get("input") or {}).items():
             value_str = str(value)
             if len(value_str) > TOOL_INPUT_TRUNCATE_LENGTH:
                 value_str = value_str[:TOOL_INPUT_TRUNCATE_LENGTH] + "..."
@@ -299,6 +338,23 @@ class ToolUseContent(ContentBlock):
         return blocks
 
 
+def _result_item_to_string(item: dict[str, Any]) -> str:
+    """Render one item of a list-valued tool result as text."""
+    item_type = item.get("type")
+    if item_type == "text":
+        return item.get("text", "")
+    if item_type == "image":
+        media_type = item.get("source", {}).get("media_type", "unknown")
+        return f"[Image: {media_type}]"
+    # Handle unknown content types (e.g., tool_reference)
+    item_type = item.get("type", "unknown")
+    # Include any descriptive fields
+    detail_str = ", ".join(f"{k}={v}" for k, v in item.items() if k != "type" and v)
+    if detail_str:
+        return f"[{item_type}: {detail_str}]"
+    return f"[{item_type}]"
+
+
 class ToolResultContent(ContentBlock):
     """Tool result content block."""
 
@@ -310,69 +366,57 @@ class ToolResultContent(ContentBlock):
     _filter_name: ClassVar[str] = "tools"
     _filter_description: ClassVar[str] = "Tool invocations and results"
 
-    def render(self, config: RenderConfig) -> list[RenderBlock]:
+    @classmethod
+    def render_item(
+        cls, item: dict[str, Any], config: RenderConfig
+    ) -> list[RenderBlock]:
         if not config.filters.is_visible("tools"):
             return []
 
         blocks: list[RenderBlock] = []
 
         # Result header
-        if self.is_error:
+        if item.get("is_error"):
             blocks.append(
-                HeaderBlock(text="Error", icon="✗", level=3, styles={Style.ERROR})
+                HeaderBlock(text="Error", icon="✗", level=3, styles=Style.ERROR)
             )
         else:
             blocks.append(
-                HeaderBlock(text="Result", icon="✓", level=3, styles={Style.SUCCESS})
+                HeaderBlock(text="Result", icon="✓", level=3, styles=Style.SUCCESS)
             )
 
         blocks.append(
-            TextBlock(text=f"({self.tool_use_id})", indent=1, styles={Style.METADATA})
+            TextBlock(
+                text=f"({item.get('tool_use_id', '')})",
+                indent=1,
+                styles=Style.METADATA,
+            )
         )
 
         # Result content
-        if self.content:
-            content_str = self._content_to_string()
-            lines = content_str.split("\n")
-
-            for line in lines[:TOOL_RESULT_PREVIEW_LINES]:
-                blocks.append(TextBlock(text=line, indent=2))
+        content = item.get("content")
+        if content:
+            preview, total = _preview_lines(cls._content_to_string(content))
+            blocks.append(TextBlock(text=preview, indent=2))
 
-            if len(lines) > TOOL_RESULT_PREVIEW_LINES:
+            if total > TOOL_RESULT_PREVIEW_LINES:
                 blocks.append(
                     TextBlock(
-                        text=f"... ({len(lines)} lines total)",
+                        text=f"... ({total} lines total)",
                         indent=2,
-                        styles={Style.METADATA},
+                        styles=Style.METADATA,
                     )
                 )
 
         return blocks
 
-    def _content_to_string(self) -> str:
+    @staticmethod
+    def _content_to_string(content: ToolResultContentValue) -> str:
         """Convert content to string representation."""
-        if isinstance(self.content, str):
-            return self.content
+        if isinstance(content, str):
+            return content
         # List of text/image items
-        parts: list[str] = []
-        for item in self.content:
-            if item.get("type") == "text":
-                parts.append(item.get("text", ""))
-            elif item.get("type") == "image":
-                media_type = item.get("source", {}).get("media_type", "unknown")
-                parts.append(f"[Image: {media_type}]")
-            else:
-                # Handle unknown content types (e.g., tool_reference)
-                item_type = item.get("type", "unknown")
-                # Include any descriptive fields
-                details = {k: v for k, v in item.items() if k != "type" and v}
-                detail_str = ", ".join(f"{k}={v}" for k, v in details.items())
-                label = f"[{item_type}"
-                if detail_str:
-                    label += f": {detail_str}"
-                label += "]"
-                parts.append(label)
-        return "\n".join(parts)
+        return "\n".join(_result_item_to_string(item) for item in content)
 
 
 class ImageContent(ContentBlock):
@@ -381,15 +425,28 @@ class ImageContent(ContentBlock):
     type: Literal["image"] = "image"
     source: ImageSourceInfo = Field(default_factory=dict)  # type: ignore[assignment]
 
-    def render(self, config: RenderConfig) -> list[RenderBlock]:
-        media_type = self.source.get("media_type", "unknown")
+    @classmethod
+    def render_item(
+        cls, item: dict[str, Any], config: RenderConfig
+    ) -> list[RenderBlock]:
+        media_type = (item.get("source") or {}).get("media_type", "unknown")
         return [
             HeaderBlock(
-                text=f"Image ({media_type})", icon="🖼", level=3, styles={Style.USER}
+                text=f"Image ({media_type})", icon="🖼", level=3, styles=Style.USER
             )
         ]
 
 
+# Content item type -> block class, for rendering raw items by their tag
+_CONTENT_BLOCKS: dict[str, type[ContentBlock]] = {
+    "text": TextContent,
+    "thinking": ThinkingContent,
+    "tool_use": ToolUseContent,
+    "tool_result": ToolResultContent,
+    "image": ImageContent,
+}
+
+
 # =============================================================================
 # Content Block Sentinel Filters
 # =============================================================================
@@ -469,34 +526,16 @@ class BaseMessage(BaseModel):
         if not config.filters.is_visible("metadata"):
             return []
 
-        blocks: list[RenderBlock] = []
-        blocks.append(TextBlock(text="-- Metadata", indent=1, styles={Style.METADATA}))
-
+        # One block for the whole section; the formatter styles each line
+        lines = ["-- Metadata"]
         if self.uuid:
-            blocks.append(
-                TextBlock(
-                    text=f"| uuid: {self.uuid}", indent=1, styles={Style.METADATA}
-                )
-            )
+            lines.append(f"| uuid: {self.uuid}")
         if self.sessionId:
-            blocks.append(
-                TextBlock(
-                    text=f"| session: {self.sessionId}",
-                    indent=1,
-                    styles={Style.METADATA},
-                )
-            )
+            lines.append(f"| session: {self.sessionId}")
         if self.timestamp:
-            blocks.append(
-                TextBlock(
-                    text=f"| timestamp: {self.timestamp}",
-                    indent=1,
-                    styles={Style.METADATA},
-                )
-            )
-
-        blocks.append(TextBlock(text="--", indent=1, styles={Style.METADATA}))
-        return blocks
+            lines.append(f"| timestamp: {self.timestamp}")
+        lines.append("--")
+        return [TextBlock(text="\n".join(lines), indent=1, styles=Style.METADATA)]
 
 
 class AgentStyleMessage(BaseMessage):
@@ -529,7 +568,7 @@ class AgentStyleMessage(BaseMessage):
                 text=self.get_agent_label(),
                 icon=self.get_agent_icon(),
                 level=2,
-                styles={Style.ASSISTANT, Style.BOLD},
+                styles=Style.ASSISTANT | Style.BOLD,
                 suffix=self.format_timestamp_suffix(config),
             )
         ]
@@ -539,27 +578,9 @@ class AgentStyleMessage(BaseMessage):
         blocks: list[RenderBlock] = []
 
         for item in self.get_content_items():
-            content_type = item.get("type", "")
-
-            if content_type == "text":
-                content = TextContent(**item)
-                blocks.extend(content.render(config))
-
-            elif content_type == "thinking":
-                content = ThinkingContent(**item)
-                blocks.extend(content.render(config))
-
-            elif content_type == "tool_use":
-                content = ToolUseContent(**item)
-                blocks.extend(content.render(config))
-
-            elif content_type == "tool_result":
-                content = ToolResultContent(**item)
-                blocks.extend(content.render(config))
-
-            elif content_type == "image":
-                content = ImageContent(**item)
-                blocks.extend(content.render(config))
+            block_cls = _CONTENT_BLOCKS.get(item.get("type", ""))
+            if block_cls is not None:
+                blocks.extend(block_cls.render_item(item, config))
 
         return blocks
 
@@ -575,7 +596,7 @@ class AgentStyleMessage(BaseMessage):
                 TextBlock(
                     text=f"Tokens: in={in_tokens} out={out_tokens} cache={cache_read}",
                     indent=1,
-                    styles={Style.METADATA},
+                    styles=Style.METADATA,
                 )
             ]
         return []
@@ -608,7 +629,7 @@ class SystemStyleMessage(BaseMessage):
                 text=self.get_system_label(),
                 icon=self.get_system_icon(),
                 level=2,
-                styles={Style.SYSTEM},
+                styles=Style.SYSTEM,
             )
         ]
 
@@ -706,28 +727,23 @@ class UserMessage(BaseMessage):
                 text=label,
                 icon="◂",
                 level=2,
-                styles={Style.USER},
+                styles=Style.USER,
                 suffix=self.format_timestamp_suffix(config),
             )
         )
 
         content = self.message.get("content")
         if isinstance(content, str) and content:
-            for line in content.split("\n"):
-                blocks.append(TextBlock(text=line, indent=1))
+            blocks.append(TextBlock(text=content, indent=1))
         elif isinstance(content, list):
             for item in content:
                 item_type = item.get("type", "")
                 if item_type == "text":
-                    text = item.get("text", "")
-                    for line in text.split("\n"):
-                        blocks.append(TextBlock(text=line, indent=1))
+                    blocks.append(TextBlock(text=item.get("text", ""), indent=1))
                 elif item_type == "tool_result":
-                    result = ToolResultContent(**item)
-                    blocks.extend(result.render(config))
+                    blocks.extend(ToolResultContent.render_item(item, config))
                 elif item_type == "image":
-                    img = ImageContent(**item)
-                    blocks.extend(img.render(config))
+                    blocks.extend(ImageContent.render_item(item, config))
 
         blocks.extend(self.render_metadata(config))
         blocks.append(SpacerBlock())
@@ -741,8 +757,7 @@ class UserMessage(BaseMessage):
         if isinstance(content, list):
             for item in content:
                 if item.get("type") == "tool_result":
-                    result = ToolResultContent(**item)
-                    blocks.extend(result.render(config))
+                    blocks.extend(ToolResultContent.render_item(item, config))
 
         blocks.extend(self.render_metadata(config))
         blocks.append(SpacerBlock())
@@ -759,7 +774,7 @@ class UserMessage(BaseMessage):
                 text=f"SUB-AGENT ({agent_id})",
                 icon="◆",
                 level=2,
-                styles={Style.ASSISTANT, Style.BOLD},
+                styles=Style.ASSISTANT | Style.BOLD,
                 suffix=self.format_timestamp_suffix(config),
             )
         )
@@ -768,9 +783,7 @@ class UserMessage(BaseMessage):
         content_items = self.toolUseResult.get("content", [])
         for item in content_items:
             if isinstance(item, dict) and item.get("type") == "text":
-                text = item.get("text", "")
-                for line in text.split("\n"):
-                    blocks.append(TextBlock(text=line, indent=1))
+                blocks.append(TextBlock(text=item.get("text", ""), indent=1))
 
         # Token usage
         total_tokens = self.toolUseResult.get("totalTokens", 0)
@@ -779,7 +792,7 @@ class UserMessage(BaseMessage):
                 TextBlock(
                     text=f"Total tokens: {total_tokens}",
                     indent=1,
-                    styles={Style.METADATA},
+                    styles=Style.METADATA,
                 )
             )
 
@@ -795,27 +808,17 @@ class UserMessage(BaseMessage):
 
         if content.startswith("<command-name>"):
             # Parse command
-            cmd_name = ""
-            cmd_args = ""
-
-            if "<command-name>" in content and "</command-name>" in content:
-                start = content.index("<command-name>") + len("<command-name>")
-                end = content.index("</command-name>")
-                if start < end:
-                    cmd_name = content[start:end]
-
-            if "<command-args>" in content and "</command-args>" in content:
-                start = content.index("<command-args>") + len("<command-args>")
-                end = content.index("</command-args>")
-                if start < end:
-                    cmd_args = content[start:end]
+            name_match = _COMMAND_NAME_RE.search(content)
+            cmd_name = name_match.group(1) if name_match else ""
+            args_match = _COMMAND_ARGS_RE.search(content)
+            cmd_args = args_match.group(1) if args_match else ""
 
             blocks.append(
                 HeaderBlock(
                     text=f"Command: {cmd_name}",
                     icon="▸",
                     level=3,
-                    styles={Style.USER},
+                    styles=Style.USER,
                     suffix=self.format_timestamp_suffix(config),
                 )
             )
@@ -830,19 +833,18 @@ class UserMessage(BaseMessage):
                 )
 
                 blocks.append(
-                    HeaderBlock(text="Output", icon="◆", level=3, styles={Style.USER})
+                    HeaderBlock(text="Output", icon="◆", level=3, styles=Style.USER)
                 )
 
-                lines = stdout.split("\n")
-                for line in lines[:TOOL_RESULT_PREVIEW_LINES]:
-                    blocks.append(TextBlock(text=line, indent=2))
+                preview, total = _preview_lines(stdout)
+                blocks.append(TextBlock(text=preview, indent=2))
 
-                if len(lines) > TOOL_RESULT_PREVIEW_LINES:
+                if total > TOOL_RESULT_PREVIEW_LINES:
                     blocks.append(
                         TextBlock(
-                            text=f"... ({len(lines)} lines total)",
+                            text=f"... ({total} lines total)",
                             indent=2,
-                            styles={Style.METADATA},
+                            styles=Style.METADATA,
                         )
                     )
 
@@ -876,7 +878,7 @@ class SystemMessage(SystemStyleMessage):
                 text=f"SYSTEM ({self.subtype})",
                 icon="▸",
                 level=2,
-                styles={Style.SYSTEM},
+                styles=Style.SYSTEM,
                 suffix=self.format_timestamp_suffix(config),
             )
         )
@@ -919,7 +921,7 @@ class FileHistorySnapshot(SystemStyleMessage):
                 text=f"File History Snapshot ({timestamp})",
                 icon="📸",
                 level=2,
-                styles={Style.SYSTEM},
+                styles=Style.SYSTEM,
                 suffix=self.format_timestamp_suffix(config),
             ),
             SpacerBlock(),
@@ -941,7 +943,7 @@ class SummaryMessage(BaseMessage):
                 icon="📋",
                 prefix="Summary:",
                 level=1,
-                styles={Style.INFO},
+                styles=Style.INFO,
                 suffix=self.format_timestamp_suffix(config),
             ),
             SpacerBlock(),
@@ -965,14 +967,13 @@ class QueueOperationMessage(SystemStyleMessage):
                 text=f"Queue: {self.operation}",
                 icon="⚙",
                 level=2,
-                styles={Style.SYSTEM},
+                styles=Style.SYSTEM,
                 suffix=self.format_timestamp_suffix(config),
             )
         )
 
         if self.content:
-            for line in self.content.split("\n"):
-                blocks.append(TextBlock(text=line, indent=1))
+            blocks.append(TextBlock(text=self.content, indent=1))
 
         blocks.extend(self.render_metadata(config))
         blocks.append(SpacerBlock())
@@ -1002,7 +1003,7 @@ class ResultMessage(BaseMessage):
             HeaderBlock(
                 text="SESSION COMPLETE",
                 level=1,
-                styles={Style.BOLD, Style.INFO},
+                styles=Style.BOLD | Style.INFO,
                 suffix=self.format_timestamp_suffix(config),
             )
         )
@@ -1055,20 +1056,20 @@ class ProgressMessage(SystemStyleMessage):
                     text=f"Hook: {hook_name}",
                     icon="⚙",
                     level=3,
-                    styles={Style.SYSTEM},
+                    styles=Style.SYSTEM,
                     suffix=self.format_timestamp_suffix(config),
                 )
             )
             command = self.data.get("command", "")
             if command:
-                blocks.append(TextBlock(text=command, indent=1, styles={Style.DIM}))
+                blocks.append(TextBlock(text=command, indent=1, styles=Style.DIM))
         elif progress_type == "agent_progress":
             blocks.append(
                 HeaderBlock(
                     text="Agent Progress",
                     icon="⚙",
                     level=3,
-                    styles={Style.SYSTEM},
+                    styles=Style.SYSTEM,
                     suffix=self.format_timestamp_suffix(config),
                 )
             )
@@ -1078,7 +1079,7 @@ class ProgressMessage(SystemStyleMessage):
                     text=f"Progress ({progress_type})",
                     icon="⚙",
                     level=3,
-                    styles={Style.SYSTEM},
+                    styles=Style.SYSTEM,
                     suffix=self.format_timestamp_suffix(config),
                 )
             )
@@ -1104,7 +1105,7 @@ class LastPromptMessage(BaseMessage):
                 text="Last Prompt",
                 icon="💬",
                 level=3,
-                styles={Style.INFO},
+                styles=Style.INFO,
                 suffix=self.format_timestamp_suffix(config),
             )
         )
@@ -1200,27 +1201,24 @@ Message = Annotated[
 ]
 
 
-class _MessageAdapter(BaseModel):
-    """Internal adapter for parsing messages via discriminated union."""
-
-    root: Message
+# Built once at import so the union's validator is reused for every message
+_MESSAGE_ADAPTER: TypeAdapter[Any] = TypeAdapter(Message)
 
-    model_config = {"extra": "allow"}
 
+def _build_message_types() -> frozenset[str]:
+    """Collect the ``type`` tag of every union variant."""
+    tags: list[str] = []
+    for cls in get_args(get_args(Message)[0]):
+        cls_tags = get_args(cls.model_fields["type"].annotation)
+        if len(cls_tags) != 1:
+            raise TypeError(f"{cls.__name__}.type must be a single Literal tag")
+        tags.append(cls_tags[0])
+    return frozenset(tags)
 
-_known_types_cache: set[str] | None = None
 
-
-def _get_known_types() -> set[str]:
-    """Get the set of known message type names from the registry."""
-    global _known_types_cache
-    if _known_types_cache is None:
-        _known_types_cache = {
-            name
-            for name, info in get_filter_registry().items()
-            if info["category"] == "type"
-        }
-    return _known_types_cache
+# Discriminator tags, derived from the union itself so the known-type check
+# in parse_message can never drift from the union members
+_MESSAGE_TYPES: frozenset[str] = _build_message_types()
 
 
 def parse_message(data: dict[str, Any]) -> BaseMessage:
@@ -1231,11 +1229,10 @@ def parse_message(data: dict[str, Any]) -> BaseMessage:
     """
     msg_type = data.get("type", "")
 
-    if msg_type in _get_known_types():
+    if msg_type in _MESSAGE_TYPES:
         try:
-            adapter = _MessageAdapter(root=data)  # type: ignore[arg-type]
-            return adapter.root
-        except Exception:
+            return _MESSAGE_ADAPTER.validate_python(data)
+        except ValidationError:
             # Fall back to base message if discriminated union fails
             return BaseMessage(**data)
     else:
@@ -1,13 +1,19 @@
 """Stream processing functions for JSONL data.
 
-This module contains the filtering logic (should_show_message) and
-the main stream processing function (process_stream).
+This module contains the filtering logic (should_show_message, and
+compile_filter for loops over many messages) and the main stream
+processing function (process_stream).
 """
 
 from __future__ import annotations
 
+import functools
 import json
+import mmap
+import re
 import sys
+from collections import deque
+from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import Any, TextIO
 
@@ -15,6 +21,7 @@ from .blocks import Style, TextBlock
 from .formatters import Formatter
 from .models import (
     BaseMessage,
+    FilterConfig,
     UserMessage,
     RenderConfig,
     get_filter_registry,
@@ -22,6 +29,190 @@ from .models import (
 )
 
 
+# Optional orjson for faster line decoding
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+
+def decode_line(line: str | bytes) -> Any:
+    """Decode one JSON line, via orjson when it is installed.
+
+    Anything orjson rejects (NaN/Infinity, lone surrogates) is retried with
+    json.loads, so invalid lines raise the usual json.JSONDecodeError. Note
+    orjson decodes integers wider than 64 bits as floats.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line)
+
+
+# Coalesce output from file replays into writes of roughly this many chars
+OUTPUT_BATCH_SIZE = 32 * 1024
+
+
+class BatchedWriter:
+    """Collect formatted messages and write them to a stream in batches.
+
+    In live mode (input that may block waiting for more data, e.g. a pipe)
+    every message is written through immediately so nothing sits in the
+    batch while the reader waits.
+    """
+
+    def __init__(self, stream: TextIO, live: bool = False) -> None:
+        self._stream = stream
+        self._live = live
+        self._pending: list[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> None:
+        """Queue one formatted message (a trailing newline is added)."""
+        if self._live:
+            self._stream.write(text + "\n")
+            return
+        self._pending.append(text)
+        self._size += len(text)
+        if self._size >= OUTPUT_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out everything queued so far."""
+        if self._pending:
+            self._pending.append("")
+            self._stream.write("\n".join(self._pending))
+            self._pending.clear()
+            self._size = 0
+
+
+def _is_live_input(input_file: Any) -> bool:
+    """Whether reading input_file may block waiting for more data."""
+    try:
+        return not input_file.seekable()
+    except (AttributeError, ValueError):
+        return True
+
+
+def tail_offset(input_file: Any, n: int, count_lines: bool) -> tuple[int, int] | None:
+    """Find where the last n lines of a regular file start, scanning from EOF.
+
+    Only the tail pages of the file are touched (via mmap + rfind), so
+    ``-n 50`` on a multi-GB session costs the same as on a small one.
+
+    Returns (byte_offset, lines_before_offset), or None if the input
+    cannot be memory-mapped (pipes, in-memory streams, empty files).
+    ``lines_before_offset`` is only computed when count_lines is set.
+    """
+    try:
+        base = input_file.tell()
+        mm = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        return None
+
+    with mm:
+        end = len(mm)
+        # A trailing newline terminates the last line; it doesn't start one
+        if end > base and mm[end - 1] == 0x0A:
+            end -= 1
+        offset = base
+        for _ in range(n):
+            idx = mm.rfind(b"\n", base, end)
+            if idx < 0:
+                offset = base
+                break
+            offset = idx + 1
+            end = idx
+
+        lines_before = 0
+        if count_lines:
+            chunk = 1 << 20
+            for pos in range(base, offset, chunk):
+                lines_before += mm[pos : min(pos + chunk, offset)].count(b"\n")
+
+    return offset, lines_before
+
+
+@functools.lru_cache(maxsize=32)
+def _literal_matcher(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile literal --grep/--exclude substrings into one regex.
+
+    Patterns are escaped, so matching semantics stay plain substring
+    containment; a message is scanned once regardless of pattern count.
+    """
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
+# Patterns made only of these characters (and not starting or ending with a
+# space) cannot span JSON punctuation, separator whitespace, number
+# formatting or backslash escapes. On such patterns the raw JSONL line and
+# json.dumps(data) agree, except where the two spell the same value
+# differently; the cases below cover those
+_RAW_SAFE_PATTERN = re.compile(r"[A-Za-z_./](?:[A-Za-z_./ ]*[A-Za-z_./])?")
+
+# Text json.dumps may add or drop when it re-formats a number (1E5 ->
+# 100000.0, 1e400 -> Infinity, 1e20 as a float -> 1e+20); patterns that fit
+# inside one of these are never raw-safe
+_NUMBER_TEXTS = (".", "e", "E", "Infinity")
+
+# json.dumps writes non-ASCII as \uXXXX, so on non-ASCII lines a pattern
+# starting with one of these could match inside such an escape
+_ESCAPE_CHARS = frozenset("u0123456789abcdef")
+
+# Raw escapes json.dumps spells differently: \/ (written as /), \u escapes
+# of printable ASCII or of \b \t \n \f \r (written as the character or its
+# short escape) and uppercase hex digits (written lowercase). A line
+# containing one may match in one form but not the other, so it is always
+# parsed. Other control-character escapes (e.g. \u001b) are spelled the same
+_DIVERGENT_ESCAPE = re.compile(
+    r"\\(?:/|u(?:00(?:0[89acd]|[2-7][0-9a-f])|[0-9A-Fa-f]{0,3}[A-F]))"
+)
+
+
+def _is_raw_safe(pattern: str) -> bool:
+    """Whether pattern matches a raw line exactly when it matches json.dumps."""
+    return _RAW_SAFE_PATTERN.fullmatch(pattern) is not None and not any(
+        pattern in text for text in _NUMBER_TEXTS
+    )
+
+
+def _raw_line_filter(config: RenderConfig) -> Callable[[str], bool] | None:
+    """Build a pre-parse check that drops lines grep/exclude would reject.
+
+    Lets filtered-out lines skip json.loads entirely. Returns None when no
+    patterns are set or any pattern is not raw-safe (then every line is
+    parsed and matched as usual). Lines whose raw spelling may differ from
+    json.dumps are always kept and matched after parsing.
+    """
+    grep = tuple(config.grep_patterns)
+    exclude = tuple(config.exclude_patterns)
+    if not grep and not exclude:
+        return None
+    if not all(_is_raw_safe(p) for p in grep + exclude):
+        return None
+
+    grep_search = _literal_matcher(grep).search if grep else None
+    exclude_search = _literal_matcher(exclude).search if exclude else None
+    grep_may_hit_escape = any(p[0] in _ESCAPE_CHARS for p in grep)
+    divergent = _DIVERGENT_ESCAPE.search
+
+    def keep(line: str) -> bool:
+        if exclude_search is not None and exclude_search(line):
+            return divergent(line) is not None
+        if grep_search is not None and not grep_search(line):
+            if grep_may_hit_escape and not line.isascii():
+                return True
+            return divergent(line) is not None
+        return True
+
+    return keep
+
+
 _subtype_names_cache: set[str] | None = None
 
 
@@ -41,82 +232,168 @@ def should_show_message(
     msg: BaseMessage, data: dict[str, Any], config: RenderConfig
 ) -> bool:
     """Determine if a message should be displayed based on filters."""
+    return _should_show_data(data, config) and _should_show_parsed(msg, config)
+
+
+class MessageFilter:
+    """The filters of one RenderConfig, compiled once for many messages.
+
+    Filtering runs in two phases so rejected lines cost as little as
+    possible: show_data decides everything the decoded JSON alone can
+    (types, subtypes, hidden tools, time range, grep/exclude) before a model
+    is built, and show_parsed applies the checks that need the parsed model
+    (user subtypes). A message is shown when both pass::
+
+        msg_filter = compile_filter(config)
+        if msg_filter.show_data(data):
+            msg = parse_message(data)
+            if msg_filter.show_parsed(msg):
+                ...
+
+    Calling the filter with (msg, data) runs both, like should_show_message.
+    """
+
+    def __init__(self, config: RenderConfig) -> None:
+        self.config = config
+        self.show_data = _compile_data_filter(config)
+
+    def show_parsed(self, msg: BaseMessage) -> bool:
+        """Apply the filters that need the parsed model."""
+        return _should_show_parsed(msg, self.config)
+
+    def __call__(self, msg: BaseMessage, data: dict[str, Any]) -> bool:
+        return self.show_data(data) and self.show_parsed(msg)
+
+
+def compile_filter(config: RenderConfig) -> MessageFilter:
+    """Compile config's filters for repeated use; see MessageFilter."""
+    return MessageFilter(config)
+
+
+def _show_only_has_subtypes(filters: FilterConfig) -> bool:
+    """Whether show_only explicitly names any subtype."""
+    return bool(filters.show_only & _get_subtype_names())
+
+
+def _should_show_data(data: dict[str, Any], config: RenderConfig) -> bool:
+    """Apply every filter that can be decided from the decoded JSON alone.
+
+    This runs before Pydantic validation, so messages rejected here (e.g.
+    default-hidden types like progress) never get a model built for them.
+    Loops over many messages should build the predicate once with
+    compile_filter instead.
+    """
+    return _compile_data_filter(config)(data)
+
+
+def _compile_data_filter(
+    config: RenderConfig,
+) -> Callable[[dict[str, Any]], bool]:
+    """Build the _should_show_data predicate for a fixed config.
+
+    Everything that depends only on the config (whether show_only names
+    subtypes, whether any name is hidden, the grep/exclude matchers) is
+    resolved here once, so the per-message predicate only runs the checks
+    that can actually reject something.
+    """
     filters = config.filters
+    is_visible = filters.is_visible
+    hidden = filters.hidden
+    shown = filters.shown
+    show_only = filters.show_only
+    subtype_whitelist = _show_only_has_subtypes(filters)
+    before = config.before
+    after = config.after
+    grep = (
+        _literal_matcher(tuple(config.grep_patterns)).search
+        if config.grep_patterns
+        else None
+    )
+    exclude = (
+        _literal_matcher(tuple(config.exclude_patterns)).search
+        if config.exclude_patterns
+        else None
+    )
 
-    # Check message type visibility
-    if not filters.is_visible(msg.type):
-        return False
+    def show(data: dict[str, Any]) -> bool:
+        msg_type = data.get("type", "")
 
-    # Check subtype visibility — subtypes only block a message when
-    # they are explicitly hidden or when show_only explicitly names subtypes.
-    # If show_only only contains type-level names (e.g. "user"), subtypes
-    # (e.g. "user-input") pass through.
-    _SUBTYPE_NAMES = _get_subtype_names()
-    _show_only_has_subtypes = bool(filters.show_only & _SUBTYPE_NAMES)
-
-    if isinstance(msg, UserMessage):
-        subtype = msg.get_subtype()
-        # Explicit hide (unless also explicitly shown)
-        if subtype in filters.hidden and subtype not in filters.shown:
+        # Check message type visibility
+        if not is_visible(msg_type):
             return False
-        # If show_only explicitly names subtypes, enforce the whitelist
-        if _show_only_has_subtypes and subtype not in filters.show_only:
-            if subtype not in filters.shown:
+
+        # Check subtype visibility — subtypes only block a message when
+        # they are explicitly hidden or when show_only explicitly names
+        # subtypes. If show_only only contains type-level names (e.g.
+        # "user"), subtypes (e.g. "user-input") pass through. User subtypes
+        # are derived from the parsed model, see _should_show_parsed.
+        if msg_type != "user":
+            raw_subtype = data.get("subtype", "")
+            if raw_subtype:
+                normalized = raw_subtype.replace("_", "-")
+                if normalized in hidden and normalized not in shown:
+                    return False
+                if subtype_whitelist and normalized not in show_only:
+                    if normalized not in shown:
+                        return False
+
+        # Check tool name visibility — only blocked if explicitly hidden, so
+        # the content scan is skipped entirely when nothing is hidden
+        if hidden:
+            content = data.get("message", {}).get("content", [])
+            if isinstance(content, list):
+                for item in content:
+                    if isinstance(item, dict) and item.get("type") == "tool_use":
+                        tool_name = item.get("name")
+                        if tool_name in hidden and tool_name not in shown:
+                            return False
+
+        # Timestamp filtering
+        if before or after:
+            ts_str = data.get("timestamp", "")
+            if ts_str:
+                try:
+                    msg_dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+                    if msg_dt.tzinfo is None:
+                        msg_dt = msg_dt.replace(tzinfo=timezone.utc)
+                    if after and msg_dt < after:
+                        return False
+                    if before and msg_dt > before:
+                        return False
+                except (ValueError, OSError):
+                    pass
+
+        # Grep/exclude (serialize once for both)
+        if grep or exclude:
+            msg_str = json.dumps(data)
+            if grep and not grep(msg_str):
                 return False
-        # Tool-result / subagent-result also require "tools" visibility
-        if subtype in ("tool-result", "subagent-result") and not filters.is_visible(
-            "tools"
-        ):
-            return False
-    else:
-        raw_subtype = getattr(msg, "subtype", "")
-        if raw_subtype:
-            normalized = raw_subtype.replace("_", "-")
-            if normalized in filters.hidden and normalized not in filters.shown:
+            if exclude and exclude(msg_str):
                 return False
-            if _show_only_has_subtypes and normalized not in filters.show_only:
-                if normalized not in filters.shown:
-                    return False
 
-    # Check tool name visibility — only blocked if explicitly hidden
-    content = data.get("message", {}).get("content", [])
-    if isinstance(content, list):
-        tool_names = {
-            item.get("name")
-            for item in content
-            if isinstance(item, dict) and item.get("type") == "tool_use"
-        }
-        if tool_names:
-            for tool_name in tool_names:
-                if tool_name in filters.hidden and tool_name not in filters.shown:
-                    return False
+        return True
 
-    # Timestamp filtering
-    if config.before or config.after:
-        ts_str = data.get("timestamp", "")
-        if ts_str:
-            try:
-                msg_dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-                if msg_dt.tzinfo is None:
-                    msg_dt = msg_dt.replace(tzinfo=timezone.utc)
-                if config.after and msg_dt < config.after:
-                    return False
-                if config.before and msg_dt > config.before:
-                    return False
-            except (ValueError, OSError):
-                pass
+    return show
 
-    # Grep/exclude
-    if config.grep_patterns:
-        msg_str = json.dumps(data)
-        if not any(pattern in msg_str for pattern in config.grep_patterns):
-            return False
-    if config.exclude_patterns:
-        msg_str = json.dumps(data)
-        if any(pattern in msg_str for pattern in config.exclude_patterns):
-            return False
 
-    return True
+def _should_show_parsed(msg: BaseMessage, config: RenderConfig) -> bool:
+    """Apply the filters that need the parsed model (user subtypes)."""
+    if not isinstance(msg, UserMessage):
+        return True
+
+    filters = config.filters
+    subtype = msg.get_subtype()
+    # Explicit hide (unless also explicitly shown)
+    if subtype in filters.hidden and subtype not in filters.shown:
+        return False
+    # If show_only explicitly names subtypes, enforce the whitelist
+    if _show_only_has_subtypes(filters) and subtype not in filters.show_only:
+        if subtype not in filters.shown:
+            return False
+    # Tool-result / subagent-result also require "tools" visibility
+    return subtype not in ("tool-result", "subagent-result") or filters.is_visible(
+        "tools"
+    )
 
 
 def process_stream(
@@ -130,40 +407,70 @@ def process_stream(
         formatter: Output formatter
         tail_lines: If > 0, only process the last N lines
     """
-    # If tail_lines specified, read all and take last N
+    # If tail_lines specified, seek to the last N lines (or stream through
+    # and keep the last N when the input can't be scanned backwards)
+    tail = None
     if tail_lines > 0:
-        all_lines = input_file.readlines()
-        lines_to_process = all_lines[-tail_lines:]
-        start_line_num = max(0, len(all_lines) - tail_lines)
+        tail = tail_offset(
+            input_file, tail_lines, config.filters.is_visible("line-numbers")
+        )
+    if tail is not None:
+        offset, start_line_num = tail
+        input_file.seek(offset)
+        lines_to_process = input_file
+    elif tail_lines > 0:
+        # Keep only the last N lines in memory; enumerate supplies the
+        # line number of the first kept line
+        kept = deque(enumerate(input_file), maxlen=tail_lines)
+        lines_to_process = [line for _, line in kept]
+        start_line_num = kept[0][0] if kept else 0
     else:
         lines_to_process = input_file
         start_line_num = 0
 
     line_num = start_line_num
+    out = BatchedWriter(sys.stdout, live=_is_live_input(input_file))
+    keep_line = _raw_line_filter(config)
+    msg_filter = compile_filter(config)
+    show_data = msg_filter.show_data
+    show_parsed = msg_filter.show_parsed
 
-    for line in lines_to_process:
-        line_num += 1
-        line = line.strip()
+    # Loop invariants, looked up once rather than per message
+    show_line_numbers = config.filters.is_visible("line-numbers")
+    format_blocks = formatter.format
+    write = out.write
 
-        if not line:
-            continue
+    try:
+        for line in lines_to_process:
+            line_num += 1
+            line = line.strip()
 
-        try:
-            data = json.loads(line)
-        except json.JSONDecodeError:
-            print(f"warning: invalid JSON on line {line_num}", file=sys.stderr)
-            continue
+            if not line:
+                continue
+            if keep_line is not None and not keep_line(line):
+                continue
+
+            try:
+                data = decode_line(line)
+            except json.JSONDecodeError:
+                print(f"warning: invalid JSON on line {line_num}", file=sys.stderr)
+                continue
+
+            # Cheap dict-level filters first; only survivors get validated
+            if not show_data(data):
+                continue
 
-        msg = parse_message(data)
+            msg = parse_message(data)
 
-        if not should_show_message(msg, data, config):
-            continue
+            if not show_parsed(msg):
+                continue
 
-        # Add line number prefix if enabled
-        blocks = msg.render(config)
+            # Add line number prefix if enabled
+            blocks = msg.render(config)
 
-        if config.filters.is_visible("line-numbers"):
-            blocks.insert(0, TextBlock(text=f"[{line_num}]", styles={Style.METADATA}))
+            if show_line_numbers:
+                blocks.insert(0, TextBlock(text=f"[{line_num}]", styles=Style.METADATA))
 
-        output = formatter.format(blocks)
-        print(output)
+            write(format_blocks(blocks))
+    finally:
+        out.flush()
@@ -1,17 +1,20 @@
 """File watching functionality for monitoring JSONL files.
 
 This module provides FileWatcher for processing new lines in JSONL files,
-and watch_path for setting up file system monitoring.
+and watch_path for setting up file system monitoring (raw inotify on Linux,
+watchdog elsewhere).
 """
 
 from __future__ import annotations
 
 import json
+import os
 import sys
-import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from ._files import iter_jsonl
+from ._inotify import IN_CREATE, IN_MOVED_TO, INOTIFY_AVAILABLE, Inotify
 from .blocks import DividerBlock, HeaderBlock, Style
 from .formatters import ANSIFormatter, Formatter
 from .models import RenderConfig, parse_message
@@ -56,36 +59,44 @@ class FileWatcher:
 
         self.current_file = path
         header = DividerBlock(char="─", width=60)
-        file_block = HeaderBlock(
-            text=str(path), icon="📄", level=2, styles={Style.INFO}
-        )
+        file_block = HeaderBlock(text=str(path), icon="📄", level=2, styles=Style.INFO)
         print(self.formatter.format([header, file_block]))
 
     def _process_lines(self, lines: list[str]) -> None:
         """Parse JSON lines and output formatted messages."""
         # Import here to avoid circular dependency
-        from .stream import should_show_message
+        from .stream import BatchedWriter, compile_filter, decode_line
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        msg_filter = compile_filter(self.config)
+        # One write and one flush for everything this event produced
+        out = BatchedWriter(sys.stdout)
+        try:
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
 
-            try:
-                data = json.loads(line)
-                msg = parse_message(data)
+                try:
+                    data = decode_line(line)
+                    if not msg_filter.show_data(data):
+                        continue
 
-                if not should_show_message(msg, data, self.config):
-                    continue
+                    msg = parse_message(data)
+
+                    if not msg_filter.show_parsed(msg):
+                        continue
 
-                blocks = msg.render(self.config)
-                output = self.formatter.format(blocks)
-                print(output, flush=True)
+                    blocks = msg.render(self.config)
+                    out.write(self.formatter.format(blocks))
 
-            except json.JSONDecodeError:
-                print(
-                    f"warning: skipping invalid JSON: {line[:50]}...", file=sys.stderr
-                )
+                except json.JSONDecodeError:
+                    print(
+                        f"warning: skipping invalid JSON: {line[:50]}...",
+                        file=sys.stderr,
+                    )
+        finally:
+            out.flush()
+            sys.stdout.flush()
 
     def process_new_lines(self, path: Path) -> None:
         """Read and process any new lines from a file."""
@@ -96,16 +107,18 @@ class FileWatcher:
         position = self.file_positions.get(path, 0)
 
         try:
-            with open(path, "r") as f:
+            with open(path, "rb") as f:
                 f.seek(position)
                 new_content = f.read()
-                new_position = f.tell()
 
-            if new_content:
+            # Only consume complete lines; a line the writer hasn't finished
+            # flushing stays unread until its newline arrives
+            end = new_content.rfind(b"\n") + 1
+            if end:
                 self._print_file_header(path)
-                self._process_lines(new_content.split("\n"))
+                self._process_lines(new_content[:end].decode().split("\n"))
 
-            self.file_positions[path] = new_position
+            self.file_positions[path] = position + end
 
         except (IOError, OSError) as e:
             print(f"warning: file IO error for {path}: {e}", file=sys.stderr)
@@ -115,31 +128,60 @@ class FileWatcher:
         if not path.exists() or not path.is_file():
             return
 
-        try:
-            with open(path, "r") as f:
-                # Read all lines and take last N
-                lines = f.readlines()
-                tail = lines[-n:] if n < len(lines) else lines
+        from .stream import decode_line, tail_offset
 
-                # Set position to end of file for future watches
-                self.file_positions[path] = f.tell()
+        try:
+            with open(path, "rb") as f:
+                # Jump to the last N lines without reading what precedes them
+                tail = tail_offset(f, n, count_lines=False)
+                offset = tail[0] if tail else 0
+                f.seek(offset)
+                new_content = f.read()
 
-            if tail:
+            # EOF ends the last record here, so a file whose final line has
+            # no newline still shows it. Only a last line that does not parse
+            # yet is left for process_new_lines, as still being written
+            end = new_content.rfind(b"\n") + 1
+            if new_content[end:].strip():
+                try:
+                    decode_line(new_content[end:])
+                    end = len(new_content)
+                except ValueError:
+                    pass
+            if end:
                 self._print_file_header(path)
-                self._process_lines(tail)
+                self._process_lines(new_content[:end].decode().split("\n"))
+
+            self.file_positions[path] = offset + end
 
         except (IOError, OSError) as e:
             print(f"warning: file IO error for {path}: {e}", file=sys.stderr)
 
+    def on_file_modified(self, path: Path) -> None:
+        """Handle a modification event for a watched file."""
+        if path.suffix == ".jsonl":
+            self.process_new_lines(path)
+
+    def on_file_created(self, path: Path) -> None:
+        """Handle a creation event for a watched file."""
+        if path.suffix == ".jsonl":
+            # New file - start tracking from beginning
+            self.file_positions[path] = 0
+            self.process_new_lines(path)
+
     def get_initial_files(self, path: Path, recursive: bool = True) -> list[Path]:
         """Get all .jsonl files in a path."""
         if path.is_file():
             return [path]
 
         if recursive:
-            return list(path.rglob("*.jsonl"))
-        else:
-            return list(path.glob("*.jsonl"))
+            return [file_path for file_path, _mtime in iter_jsonl(path)]
+        with os.scandir(path) as it:
+            return [
+                Path(entry.path)
+                for entry in it
+                if entry.name.endswith(".jsonl") and entry.is_file()
+            ]
 
 
 if WATCHDOG_AVAILABLE:
@@ -152,22 +194,90 @@ if WATCHDOG_AVAILABLE:
             self.watcher = watcher
 
         def on_modified(self, event: FileModifiedEvent) -> None:
-            if event.is_directory:
+            if event.is_directory or not str(event.src_path).endswith(".jsonl"):
                 return
-
-            path = Path(event.src_path)
-            if path.suffix == ".jsonl":
-                self.watcher.process_new_lines(path)
+            self.watcher.on_file_modified(Path(event.src_path))
 
         def on_created(self, event: FileCreatedEvent) -> None:
-            if event.is_directory:
+            if event.is_directory or not str(event.src_path).endswith(".jsonl"):
                 return
+            self.watcher.on_file_created(Path(event.src_path))
+
+
+def _watch_inotify(
+    watcher: FileWatcher, watch_paths: list[Path], recursive: bool
+) -> None:
+    """Dispatch inotify events to the watcher until interrupted.
+
+    Files are watched through their parent directory, filtered to their
+    names, so a file replaced by an editor or log rotation keeps being
+    followed. Returns once every watched directory has been removed.
+    """
+    with Inotify() as inotify:
+        for watch_path in watch_paths:
+            inotify.add_watch(str(watch_path), recursive)
+        _print_watching()
+        try:
+            while inotify.watching:
+                _dispatch_events(watcher, inotify.read_events())
+        except KeyboardInterrupt:
+            print("\nexiting", file=sys.stderr)
+            return
+        print("warning: watched paths were removed; exiting", file=sys.stderr)
+
+
+def _dispatch_events(watcher: FileWatcher, events: list[tuple[str, int]]) -> None:
+    """Hand a drained batch of inotify events to the watcher.
+
+    A burst of appends raises many IN_MODIFY events for the same file; they
+    are merged so each file is read once per batch, in first-seen order.
+    """
+    masks: dict[str, int] = {}
+    for path, mask in events:
+        if path.endswith(".jsonl"):
+            masks[path] = masks.get(path, 0) | mask
+    for path, mask in masks.items():
+        # A file renamed into place replaces the old one; read it from the start
+        if mask & (IN_CREATE | IN_MOVED_TO):
+            watcher.on_file_created(Path(path))
+        else:
+            watcher.on_file_modified(Path(path))
+
+
+def _watch_watchdog(
+    watcher: FileWatcher, watch_dirs: list[Path], recursive: bool
+) -> None:
+    """Run a watchdog observer for the watcher until interrupted."""
+    event_handler = JSONLEventHandler(watcher)
+    observer = Observer()
+
+    for watch_dir in watch_dirs:
+        observer.schedule(event_handler, str(watch_dir), recursive=recursive)
+
+    _print_watching()
+
+    observer.start()
+    try:
+        # Block until Ctrl+C instead of waking up to poll for it; Windows
+        # can't interrupt a lock wait, so it still joins in short steps
+        if sys.platform == "win32":
+            while observer.is_alive():
+                observer.join(0.5)
+        else:
+            observer.join()
+    except KeyboardInterrupt:
+        observer.stop()
+        print("\nexiting", file=sys.stderr)
+
+    observer.join()
+
 
-            path = Path(event.src_path)
-            if path.suffix == ".jsonl":
-                # New file - start tracking from beginning
-                self.watcher.file_positions[path] = 0
-                self.watcher.process_new_lines(path)
+def _print_watching() -> None:
+    print(
+        f"\n{ANSIFormatter.DIM}Watching for changes... (Ctrl+C to stop){ANSIFormatter.RESET}\n",
+        file=sys.stderr,
+        flush=True,
+    )
 
 
 def watch_path(
@@ -179,7 +289,8 @@ def watch_path(
 ) -> None:
     """Watch one or more files or directories for changes."""
 
-    if not WATCHDOG_AVAILABLE:
+    # Prefer raw inotify on Linux; watchdog covers other platforms
+    if not INOTIFY_AVAILABLE and not WATCHDOG_AVAILABLE:
         print(
             "error: watchdog not installed. Run: pip install watchdog", file=sys.stderr
         )
@@ -200,8 +311,10 @@ def watch_path(
     if tail_lines <= 0:
         # Skip existing content - just seek to end of all files
         for file_path in initial_files:
-            if file_path.exists():
+            try:
                 watcher.file_positions[file_path] = file_path.stat().st_size
+            except OSError:
+                pass  # Vanished since the scan
     else:
         # Show last N lines from each file (most recent files first)
         for file_path in sorted(
@@ -209,26 +322,9 @@ def watch_path(
         ):
             watcher.process_tail_lines(file_path, tail_lines)
 
-    # Set up watchdog observer for each path
-    event_handler = JSONLEventHandler(watcher)
-    observer = Observer()
-
-    for path in paths:
-        watch_dir = path if path.is_dir() else path.parent
-        observer.schedule(event_handler, str(watch_dir), recursive=recursive)
-
-    print(
-        f"\n{ANSIFormatter.DIM}Watching for changes... (Ctrl+C to stop){ANSIFormatter.RESET}\n",
-        file=sys.stderr,
-        flush=True,
-    )
-
-    observer.start()
-    try:
-        while True:
-            time.sleep(0.5)
-    except KeyboardInterrupt:
-        observer.stop()
-        print("\nexiting", file=sys.stderr)
-
-    observer.join()
+    if INOTIFY_AVAILABLE:
+        _watch_inotify(watcher, paths, recursive)
+    else:
+        # Not every watchdog backend can watch a single file
+        watch_dirs = [path if path.is_dir() else path.parent for path in paths]
+        _watch_watchdog(watcher, watch_dirs, recursive)
@@ -0,0 +1,46 @@
+"""Tests for render block style flags."""
+
+from claude_logs.blocks import HeaderBlock, Style, TextBlock
+from claude_logs.formatters import ANSIFormatter, MarkdownFormatter
+
+
+class TestStyleFlags:
+    def test_default_is_empty(self):
+        assert TextBlock(text="x").styles == Style(0)
+
+    def test_set_input_is_combined(self):
+        block = TextBlock(text="x", styles={Style.BOLD, Style.INFO})
+        assert block.styles == Style.BOLD | Style.INFO
+
+    def test_flag_input_kept(self):
+        block = HeaderBlock(text="x", styles=Style.SYSTEM)
+        assert block.styles is Style.SYSTEM
+
+    def test_ansi_codes_in_definition_order(self):
+        block = TextBlock(text="x", styles=Style.INFO | Style.BOLD)
+        out = ANSIFormatter().format_block(block)
+        assert out == f"{ANSIFormatter.BOLD}{ANSIFormatter.CYAN}x{ANSIFormatter.RESET}"
+
+    def test_markdown_membership(self):
+        block = TextBlock(text="x", styles=Style.BOLD | Style.THINKING)
+        assert MarkdownFormatter().format_block(block) == "***x***"
+
+
+class TestMultilineText:
+    def _per_line(self, formatter, text, styles):
+        return "\n".join(
+            formatter.format_block(TextBlock(text=line, indent=2, styles=styles))
+            for line in text.split("\n")
+        )
+
+    def test_ansi_styles_each_line(self):
+        fmt = ANSIFormatter()
+        text = "first\n\nthird"
+        block = TextBlock(text=text, indent=2, styles=Style.THINKING)
+        assert fmt.format_block(block) == self._per_line(fmt, text, Style.THINKING)
+
+    def test_markdown_styles_each_line(self):
+        fmt = MarkdownFormatter()
+        text = "first\n\nthird"
+        block = TextBlock(text=text, indent=2, styles=Style.THINKING)
+        assert fmt.format_block(block) == self._per_line(fmt, text, Style.THINKING)
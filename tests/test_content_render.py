@@ -0,0 +1,90 @@
+"""Tests for rendering raw content items without model validation."""
+
+from claude_logs.models import (
+    AssistantMessage,
+    RenderConfig,
+    TextContent,
+    ToolResultContent,
+    ToolUseContent,
+    UserMessage,
+)
+
+
+class TestRenderItem:
+    def test_instance_render_matches_render_item(self):
+        config = RenderConfig()
+        item = {"type": "tool_use", "id": "t1", "name": "Read", "input": {"a": 1}}
+        assert ToolUseContent(**item).render(config) == ToolUseContent.render_item(
+            item, config
+        )
+
+    def test_tool_result_list_content(self):
+        item = {
+            "type": "tool_result",
+            "tool_use_id": "t1",
+            "content": [
+                {"type": "text", "text": "ok"},
+                {"type": "image", "source": {"media_type": "image/png"}},
+            ],
+        }
+        texts = [b.text for b in ToolResultContent.render_item(item, RenderConfig())]
+        assert "ok\n[Image: image/png]" in texts
+
+    def test_tool_result_unknown_item_types(self):
+        content = [
+            {"type": "tool_reference", "tool_name": "Grep", "extra": ""},
+            {"kind": "odd"},
+        ]
+        assert (
+            ToolResultContent._content_to_string(content)
+            == "[tool_reference: tool_name=Grep]\n[unknown: kind=odd]"
+        )
+
+    def test_content_blocks_not_constructed(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("content model constructed")
+
+        monkeypatch.setattr(TextContent, "__init__", fail)
+        msg = AssistantMessage(message={"content": [{"type": "text", "text": "hello"}]})
+        texts = [getattr(b, "text", "") for b in msg.render(RenderConfig())]
+        assert "hello" in texts
+
+
+class TestMultilineText:
+    def test_preview_truncated_to_limit(self):
+        from claude_logs.models import TOOL_RESULT_PREVIEW_LINES
+
+        content = "\n".join(str(i) for i in range(TOOL_RESULT_PREVIEW_LINES + 5))
+        item = {"type": "tool_result", "tool_use_id": "t", "content": content}
+        blocks = ToolResultContent.render_item(item, RenderConfig())
+        texts = [b.text for b in blocks]
+        assert texts[2] == "\n".join(content.split("\n")[:TOOL_RESULT_PREVIEW_LINES])
+        assert texts[3] == f"... ({TOOL_RESULT_PREVIEW_LINES + 5} lines total)"
+
+    def test_one_block_per_text_item(self):
+        msg = AssistantMessage(
+            message={"content": [{"type": "text", "text": "a\nb\nc"}]}
+        )
+        texts = [getattr(b, "text", None) for b in msg.render(RenderConfig())]
+        assert "a\nb\nc" in texts
+
+
+class TestLocalCommand:
+    def test_name_and_args_parsed(self):
+        msg = UserMessage(
+            message={
+                "content": "<command-name>/model</command-name>\n"
+                "<command-message>model</command-message>\n"
+                "<command-args>opus</command-args>"
+            }
+        )
+        blocks = msg.render_local_command(RenderConfig())
+        assert blocks[0].text == "Command: /model"
+        assert blocks[1].key == "args"
+        assert blocks[1].value == "opus"
+
+    def test_missing_args_omitted(self):
+        msg = UserMessage(message={"content": "<command-name>/clear</command-name>"})
+        blocks = msg.render_local_command(RenderConfig())
+        assert blocks[0].text == "Command: /clear"
+        assert not any(getattr(b, "key", None) == "args" for b in blocks)
@@ -0,0 +1,23 @@
+"""Tests for Claude project path encoding."""
+
+from claude_logs.cli import encode_path
+
+
+class TestEncodePath:
+    def test_ascii_specials_become_single_dash(self):
+        assert encode_path("/home/user/my_proj.v2") == "-home-user-my-proj-v2"
+
+    def test_alnum_and_dash_preserved(self):
+        assert encode_path("abc-XYZ-019") == "abc-XYZ-019"
+
+    def test_space(self):
+        assert encode_path("/tmp/a b") == "-tmp-a-b"
+
+    def test_unicode_letters_preserved(self):
+        assert encode_path("/tmp/café") == "-tmp-café"
+
+    def test_bmp_symbol_one_dash(self):
+        assert encode_path("/a→b") == "-a-b"
+
+    def test_smp_char_two_dashes(self):
+        assert encode_path("/a\U0001f600b") == "-a--b"
@@ -0,0 +1,65 @@
+"""Tests for the Formatter base class."""
+
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+from claude_logs.blocks import RenderBlock, Style, TextBlock
+from claude_logs.formatters import ANSIFormatter, PlainFormatter
+
+
+@dataclass(slots=True)
+class _Bracketed(RenderBlock):
+    children: list[RenderBlock] = field(default_factory=list)
+
+
+class _BracketFormatter(PlainFormatter):
+    """Wraps _Bracketed children in brackets by calling format() recursively."""
+
+    def _format_bracketed(self, block: _Bracketed) -> str:
+        return f"[{self.format(block.children)}]"
+
+    _block_handlers: ClassVar[dict[type, Any]] = {
+        **PlainFormatter._block_handlers,
+        _Bracketed: _format_bracketed,
+    }
+
+
+class TestFormatReentrancy:
+    def test_handler_may_call_format(self):
+        blocks = [
+            TextBlock(text="a"),
+            _Bracketed(children=[TextBlock(text="b")]),
+            TextBlock(text="c"),
+        ]
+        assert _BracketFormatter().format(blocks) == "a\n[b]\nc"
+
+
+class TestSubclassWithoutSuperInit:
+    def test_format_works(self):
+        class Custom(PlainFormatter):
+            def __init__(self) -> None:
+                self.calls = 0
+
+        out = Custom().format([TextBlock(text="a"), TextBlock(text="b")])
+        assert out == "a\nb"
+
+    def test_overridden_handler_used(self):
+        class Shouting(PlainFormatter):
+            def _format_text(self, block: TextBlock) -> str:
+                return block.text.upper()
+
+        assert Shouting().format([TextBlock(text="hi")]) == "HI"
+
+    def test_ansi_subclass_style_map(self):
+        class Plainish(ANSIFormatter):
+            STYLE_MAP: ClassVar[dict[Style, str]] = {
+                **ANSIFormatter.STYLE_MAP,
+                Style.INFO: "",
+            }
+
+            def __init__(self) -> None:
+                pass
+
+        block = TextBlock(text="x", styles=Style.INFO)
+        assert ANSIFormatter().format([block]) == f"{ANSIFormatter.CYAN}x\033[0m"
+        assert Plainish().format([block]) == "x"
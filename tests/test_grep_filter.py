@@ -0,0 +1,149 @@
+"""Tests for --grep/--exclude substring matching."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from claude_logs import stream
+from claude_logs.models import FilterConfig, RenderConfig, parse_message
+from claude_logs.stream import _raw_line_filter, should_show_message
+
+
+def _show(data, **config_kwargs) -> bool:
+    config = RenderConfig(**config_kwargs)
+    return should_show_message(parse_message(data), data, config)
+
+
+class TestGrepPatterns:
+    def test_any_pattern_matches(self, sample_user_message):
+        assert _show(sample_user_message, grep_patterns=["nope", "2+2"])
+
+    def test_no_pattern_matches(self, sample_user_message):
+        assert not _show(sample_user_message, grep_patterns=["nope", "zzz"])
+
+    def test_regex_metacharacters_are_literal(self, sample_user_message):
+        assert _show(sample_user_message, grep_patterns=["2+2?"])
+        assert not _show(sample_user_message, grep_patterns=["2.2"])
+
+
+class TestExcludePatterns:
+    def test_any_pattern_excludes(self, sample_user_message):
+        assert not _show(sample_user_message, exclude_patterns=["zzz", "What is"])
+
+    def test_no_pattern_keeps(self, sample_user_message):
+        assert _show(sample_user_message, exclude_patterns=["zzz", "(unused"])
+
+    def test_grep_and_exclude_combined(self, sample_user_message):
+        assert not _show(
+            sample_user_message, grep_patterns=["2+2"], exclude_patterns=["What"]
+        )
+
+
+_FIXTURE = Path(__file__).parent / "fixtures" / "v2.1.77" / "complete_session.jsonl"
+
+
+class TestCompileFilter:
+    def test_matcher_built_once(self, sample_user_message, monkeypatch):
+        calls = []
+        real = stream._literal_matcher
+        monkeypatch.setattr(
+            stream, "_literal_matcher", lambda p: calls.append(p) or real(p)
+        )
+        show = stream.compile_filter(RenderConfig(grep_patterns=["2+2"])).show_data
+        assert all(show(sample_user_message) for _ in range(5))
+        assert calls == [("2+2",)]
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            FilterConfig(),
+            FilterConfig(show_only={"user-input"}),
+            FilterConfig(hidden={"tool-result"}),
+            FilterConfig(hidden={"tools"}),
+        ],
+    )
+    def test_phases_agree_with_should_show_message(self, filters):
+        config = RenderConfig(filters=filters)
+        msg_filter = stream.compile_filter(config)
+        for line in _FIXTURE.read_text().splitlines():
+            data = json.loads(line)
+            msg = parse_message(data)
+            expected = should_show_message(msg, data, config)
+            assert msg_filter(msg, data) == expected
+            assert (msg_filter.show_data(data) and msg_filter.show_parsed(msg)) == (
+                expected
+            )
+
+
+# Lines written the way Claude Code writes them: compact, raw UTF-8
+_RAW_LINES = [
+    json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    for data in [
+        {"type": "user", "message": {"content": "hello world"}},
+        {"type": "user", "message": {"content": "caf\u00e9 \u2014 done"}},
+        {"type": "user", "message": {"content": "line one\nline two\ttab"}},
+        {"type": "assistant", "message": {"usage": {"x": 1e-7, "y": 2.5}}},
+        {"type": "user", "message": {"content": "see README.md in src/app"}},
+        {"type": "system", "content": "\u00e9t\u00e9"},
+    ]
+] + [
+    # Escapes json.dumps spells differently from the raw line
+    '{"type":"user","message":{"content":"x \\u0041BC y"}}',
+    '{"type":"user","message":{"content":"a\\/b"}}',
+    '{"type":"user","message":{"content":"esc \\u001B[0m done"}}',
+    '{"type":"user","message":{"content":"tab\\u0009here"}}',
+    json.dumps({"type": "user", "message": {"content": "caf\u00e9 a/b"}}),
+]
+
+
+class TestRawLineFilter:
+    def test_no_patterns_disables(self):
+        assert _raw_line_filter(RenderConfig()) is None
+
+    @pytest.mark.parametrize(
+        "pattern", ["2+2", "a:b", '"type"', " lead", "x,y", "07", "n", "e", ".", "E"]
+    )
+    def test_unsafe_patterns_disable(self, pattern):
+        assert _raw_line_filter(RenderConfig(grep_patterns=[pattern])) is None
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [
+            ["hello"],
+            ["done"],
+            ["d"],
+            ["u"],
+            ["README.md"],
+            ["src/app"],
+            ["ABC"],
+            ["BC y"],
+            ["a/b"],
+            ["B"],
+            ["there"],
+        ],
+    )
+    @pytest.mark.parametrize("line", _RAW_LINES)
+    def test_agrees_with_parsed_match(self, patterns, line):
+        data = json.loads(line)
+        for key in ("grep_patterns", "exclude_patterns"):
+            config = RenderConfig(**{key: patterns})
+            keep = _raw_line_filter(config)
+            assert keep is not None
+            # Never drop a line the parsed check would show
+            if not keep(line):
+                assert not should_show_message(parse_message(data), data, config)
+
+    @pytest.mark.parametrize(
+        ("line", "pattern"),
+        [
+            ('{"type":"user","message":{"content":"x \\u0041BC y"}}', "ABC"),
+            ('{"type":"user","message":{"content":"a\\/b"}}', "a/b"),
+            ('{"type":"user","message":{"content":"\\u00e9 \\u006Fk"}}', "ok"),
+        ],
+    )
+    def test_keeps_escaped_matches(self, line, pattern):
+        data = json.loads(line)
+        config = RenderConfig(grep_patterns=[pattern])
+        assert should_show_message(parse_message(data), data, config)
+        assert _raw_line_filter(config)(line)
@@ -0,0 +1,212 @@
+"""Tests for the Linux inotify watch backend."""
+
+import os
+
+import pytest
+
+from claude_logs import watcher as watcher_module
+from claude_logs._inotify import (
+    IN_CREATE,
+    IN_MODIFY,
+    IN_MOVED_TO,
+    INOTIFY_AVAILABLE,
+    Inotify,
+)
+from claude_logs.formatters import PlainFormatter
+from claude_logs.models import RenderConfig
+from claude_logs.watcher import FileWatcher, _dispatch_events, _watch_inotify
+
+pytestmark = pytest.mark.skipif(not INOTIFY_AVAILABLE, reason="requires inotify")
+
+
+class TestInotify:
+    def test_create_and_modify_events(self, tmp_path):
+        with Inotify() as inotify:
+            inotify.add_watch(str(tmp_path))
+            target = tmp_path / "a.jsonl"
+            target.write_text("x\n")
+            events = inotify.read_events(timeout=1)
+
+        paths = {path for path, _ in events}
+        masks = [mask for _, mask in events]
+        assert paths == {str(target)}
+        assert any(mask & IN_CREATE for mask in masks)
+        assert any(mask & IN_MODIFY for mask in masks)
+
+    def test_timeout_returns_empty(self, tmp_path):
+        with Inotify() as inotify:
+            inotify.add_watch(str(tmp_path))
+            assert inotify.read_events(timeout=0) == []
+
+    def test_recursive_watches_new_subdirectories(self, tmp_path):
+        with Inotify() as inotify:
+            inotify.add_watch(str(tmp_path), recursive=True)
+            subdir = tmp_path / "project"
+            subdir.mkdir()
+            assert inotify.read_events(timeout=1) == []
+
+            target = subdir / "s.jsonl"
+            target.write_text("x\n")
+            events = inotify.read_events(timeout=1)
+
+        assert {path for path, _ in events} == {os.fspath(target)}
+
+    def test_existing_subdirectories_watched(self, tmp_path):
+        (tmp_path / "nested").mkdir()
+        with Inotify() as inotify:
+            inotify.add_watch(str(tmp_path), recursive=True)
+            target = tmp_path / "nested" / "s.jsonl"
+            target.write_text("x\n")
+            assert inotify.read_events(timeout=1)
+
+    def test_file_watch_ignores_siblings(self, tmp_path):
+        target = tmp_path / "s.jsonl"
+        target.write_text("")
+        with Inotify() as inotify:
+            inotify.add_watch(str(target))
+            (tmp_path / "other.jsonl").write_text("x\n")
+            assert inotify.read_events(timeout=0.1) == []
+            with open(target, "a") as f:
+                f.write("x\n")
+            events = inotify.read_events(timeout=1)
+
+        assert events
+        assert {path for path, _ in events} == {str(target)}
+
+    def test_file_recreated_after_delete(self, tmp_path):
+        target = tmp_path / "s.jsonl"
+        target.write_text("")
+        with Inotify() as inotify:
+            inotify.add_watch(str(target))
+            target.unlink()
+            assert inotify.read_events(timeout=0.1) == []
+            assert inotify.watching
+            target.write_text("x\n")
+            events = inotify.read_events(timeout=1)
+
+        assert (str(target), IN_CREATE) in events
+
+    def test_file_replaced_by_rename(self, tmp_path):
+        target = tmp_path / "s.jsonl"
+        target.write_text("")
+        with Inotify() as inotify:
+            inotify.add_watch(str(target))
+            tmp = tmp_path / "s.jsonl.tmp"
+            tmp.write_text("x\n")
+            os.replace(tmp, target)
+            events = inotify.read_events(timeout=1)
+            assert inotify.watching
+
+        assert events == [(str(target), IN_MOVED_TO)]
+
+    def test_two_files_in_one_directory(self, tmp_path):
+        a, b = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+        a.write_text("")
+        b.write_text("")
+        with Inotify() as inotify:
+            inotify.add_watch(str(a))
+            inotify.add_watch(str(b))
+            for target in (a, b):
+                with open(target, "a") as f:
+                    f.write("x\n")
+            events = inotify.read_events(timeout=1)
+
+        assert {path for path, _ in events} == {str(a), str(b)}
+
+    def test_removed_directory_stops_watching(self, tmp_path):
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        with Inotify() as inotify:
+            inotify.add_watch(str(sub))
+            sub.rmdir()
+            inotify.read_events(timeout=1)
+            assert not inotify.watching
+
+
+class TestFileWatcherDispatch:
+    def test_created_file_is_read_from_start(self, tmp_path, capsys):
+        watcher = FileWatcher(RenderConfig(), PlainFormatter(), show_filename=False)
+        target = tmp_path / "s.jsonl"
+        target.write_text('{"type": "user", "message": {"content": "hello"}}\n')
+        watcher.file_positions[target] = 999
+
+        watcher.on_file_created(target)
+
+        assert "hello" in capsys.readouterr().out
+        assert watcher.file_positions[target] == target.stat().st_size
+
+    def test_non_jsonl_ignored(self, tmp_path, capsys):
+        watcher = FileWatcher(RenderConfig(), PlainFormatter(), show_filename=False)
+        target = tmp_path / "notes.txt"
+        target.write_text('{"type": "user", "message": {"content": "hello"}}\n')
+
+        watcher.on_file_modified(target)
+
+        assert capsys.readouterr().out == ""
+        assert target not in watcher.file_positions
+
+    def test_burst_read_once_per_file(self, tmp_path, monkeypatch):
+        watcher = FileWatcher(RenderConfig(), PlainFormatter(), show_filename=False)
+        calls = []
+        monkeypatch.setattr(watcher, "process_new_lines", calls.append)
+        a, b = str(tmp_path / "a.jsonl"), str(tmp_path / "b.jsonl")
+        events = [
+            (a, IN_MODIFY),
+            (b, IN_CREATE),
+            (a, IN_MODIFY),
+            (str(tmp_path / "x.txt"), IN_MODIFY),
+            (b, IN_MODIFY),
+        ]
+
+        _dispatch_events(watcher, events)
+
+        assert calls == [tmp_path / "a.jsonl", tmp_path / "b.jsonl"]
+        assert watcher.file_positions[tmp_path / "b.jsonl"] == 0
+
+    def test_moved_into_place_is_read_from_start(self, tmp_path, monkeypatch):
+        watcher = FileWatcher(RenderConfig(), PlainFormatter(), show_filename=False)
+        calls = []
+        monkeypatch.setattr(watcher, "process_new_lines", calls.append)
+        target = str(tmp_path / "s.jsonl")
+        watcher.file_positions[tmp_path / "s.jsonl"] = 999
+
+        _dispatch_events(watcher, [(target, IN_MOVED_TO)])
+
+        assert calls == [tmp_path / "s.jsonl"]
+        assert watcher.file_positions[tmp_path / "s.jsonl"] == 0
+
+    def test_watch_follows_replaced_file(self, tmp_path, monkeypatch, capsys):
+        watcher = FileWatcher(RenderConfig(), PlainFormatter(), show_filename=False)
+        target = tmp_path / "s.jsonl"
+        target.write_text("")
+
+        def replace_file():
+            target.unlink()
+            tmp = tmp_path / "s.jsonl.tmp"
+            tmp.write_text('{"type": "user", "message": {"content": "hello"}}\n')
+            os.replace(tmp, target)
+
+        def created(path):
+            watcher.process_new_lines(path)
+            raise KeyboardInterrupt
+
+        # Replace the file as soon as the watch is in place, then stop once
+        # the replacement has been picked up
+        monkeypatch.setattr(watcher_module, "_print_watching", replace_file)
+        monkeypatch.setattr(watcher, "on_file_created", created)
+
+        _watch_inotify(watcher, [target], recursive=False)
+
+        captured = capsys.readouterr()
+        assert "hello" in captured.out
+        assert "watched paths were removed" not in captured.err
+
+    def test_watch_exits_when_directory_removed(self, tmp_path, monkeypatch, capsys):
+        watcher = FileWatcher(RenderConfig(), PlainFormatter(), show_filename=False)
+        sub = tmp_path / "sub"
+        sub.mkdir()
+        monkeypatch.setattr(watcher_module, "_print_watching", sub.rmdir)
+
+        _watch_inotify(watcher, [sub], recursive=False)
+
+        assert "watched paths were removed" in capsys.readouterr().err
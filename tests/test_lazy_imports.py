@@ -0,0 +1,53 @@
+"""Tests for lazy package-level imports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import claude_logs
+
+
+def _modules_after(code: str) -> set[str]:
+    out = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys; print(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return set(out.split())
+
+
+class TestLazyImports:
+    def test_package_import_is_light(self):
+        modules = _modules_after("import claude_logs")
+        assert "pydantic" not in modules
+        assert "claude_logs.watcher" not in modules
+
+    def test_cli_does_not_load_watcher(self):
+        modules = _modules_after("import claude_logs.cli")
+        assert "claude_logs.watcher" not in modules
+
+    @pytest.mark.parametrize("argv", [["--help"], ["--version"], ["show", "--help"]])
+    def test_cli_help_does_not_load_pydantic(self, argv):
+        code = (
+            "import sys\n"
+            "from claude_logs.cli import main\n"
+            f"sys.argv = ['claugs', *{argv!r}]\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+        modules = _modules_after(code)
+        assert "pydantic" not in modules
+        assert "claude_logs.models" not in modules
+
+    @pytest.mark.parametrize("name", claude_logs.__all__)
+    def test_all_names_resolve(self, name):
+        assert getattr(claude_logs, name) is not None
+
+    def test_unknown_name_raises(self):
+        name = "does_not_exist"
+        with pytest.raises(AttributeError):
+            getattr(claude_logs, name)
@@ -0,0 +1,47 @@
+"""Tests for parse_message dispatch."""
+
+import pytest
+
+from claude_logs.models import BaseMessage, parse_message
+
+
+class TestParseDict:
+    def test_unknown_type_falls_back(self):
+        msg = parse_message({"type": "mystery", "uuid": "x"})
+        assert type(msg) is BaseMessage
+        assert msg.type == "mystery"
+
+    def test_invalid_known_shape_falls_back(self):
+        msg = parse_message({"type": "assistant", "message": "not a dict"})
+        assert type(msg) is BaseMessage
+        assert msg.type == "assistant"
+
+
+class TestDiscriminatedDispatch:
+    @pytest.mark.parametrize(
+        "msg_type, cls_name",
+        [
+            ("assistant", "AssistantMessage"),
+            ("user", "UserMessage"),
+            ("system", "SystemMessage"),
+            ("file-history-snapshot", "FileHistorySnapshot"),
+            ("summary", "SummaryMessage"),
+            ("queue-operation", "QueueOperationMessage"),
+            ("result", "ResultMessage"),
+            ("progress", "ProgressMessage"),
+            ("last-prompt", "LastPromptMessage"),
+        ],
+    )
+    def test_tag_selects_variant(self, msg_type, cls_name):
+        msg = parse_message({"type": msg_type})
+        assert type(msg).__name__ == cls_name
+
+    def test_known_types_match_registry(self):
+        from claude_logs.models import _MESSAGE_TYPES, get_filter_registry
+
+        registry_types = {
+            name
+            for name, info in get_filter_registry().items()
+            if info["category"] == "type"
+        }
+        assert _MESSAGE_TYPES == registry_types
@@ -3,7 +3,8 @@
 import sys
 from unittest.mock import patch
 
-from claude_logs.cli import main
+from claude_logs import cli
+from claude_logs.cli import _file_contains, main
 from conftest import create_session_file
 
 
@@ -117,3 +118,17 @@ class TestSearchComposability:
         # Should fail with "session not found", not "cannot combine"
         assert "session not found" in err.lower()
         assert "cannot combine" not in err.lower()
+
+
+class TestFileContains:
+    def test_match_spanning_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cli, "_FIND_CHUNK_SIZE", 8)
+        path = tmp_path / "s.jsonl"
+        path.write_bytes(b"0123456needle89\n")
+        assert _file_contains(path, b"needle")
+        assert not _file_contains(path, b"needles")
+
+    def test_non_ascii_needle(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        path.write_text('{"text": "caf\u00e9 \u2603"}\n', encoding="utf-8")
+        assert _file_contains(path, "café ☃".encode())
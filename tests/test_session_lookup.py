@@ -0,0 +1,48 @@
+"""Tests for locating session files under ~/.claude/projects."""
+
+import os
+
+from claude_logs._files import iter_jsonl
+from claude_logs.cli import _collect_jsonl_files, find_session_file
+
+
+def _make_tree(root):
+    files = []
+    for i, rel in enumerate(
+        ["a/one.jsonl", "a/deep/two.jsonl", "b/three.jsonl", "top.jsonl"]
+    ):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("{}\n")
+        os.utime(path, (1000 + i, 1000 + i))
+        files.append(path)
+    (root / "a" / "notes.txt").write_text("")
+    return files
+
+
+class TestIterJsonl:
+    def test_matches_rglob(self, tmp_path):
+        _make_tree(tmp_path)
+        assert [p for p, _ in iter_jsonl(tmp_path)] == list(tmp_path.rglob("*.jsonl"))
+
+    def test_yields_mtimes(self, tmp_path):
+        _make_tree(tmp_path)
+        for path, mtime in iter_jsonl(tmp_path):
+            assert mtime == path.stat().st_mtime
+
+    def test_collect_sorted_newest_first(self, tmp_path):
+        files = _make_tree(tmp_path)
+        assert _collect_jsonl_files(tmp_path) == files[::-1]
+
+
+class TestFindSessionFile:
+    def test_latest_and_by_id(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        files = _make_tree(tmp_path / ".claude" / "projects")
+        assert find_session_file(latest=True) == files[-1]
+        assert find_session_file(session_id="two") == files[1]
+        assert find_session_file(session_id="missing") is None
+
+    def test_missing_projects_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert find_session_file(latest=True) is None
@@ -0,0 +1,111 @@
+"""Tests for process_stream output batching."""
+
+import io
+import json
+import math
+
+import pytest
+
+from claude_logs import stream
+from claude_logs.formatters import PlainFormatter
+from claude_logs.models import RenderConfig
+from claude_logs.stream import process_stream
+
+
+class _LiveInput:
+    """Non-seekable line source that records stdout before each read."""
+
+    def __init__(self, lines, capsys):
+        self._lines = lines
+        self._capsys = capsys
+        self.seen_before_read: list[str] = []
+
+    def seekable(self):
+        return False
+
+    def __iter__(self):
+        for line in self._lines:
+            self.seen_before_read.append(self._capsys.readouterr().out)
+            yield line
+
+
+class TestBatchedOutput:
+    def test_output_independent_of_batch_size(
+        self, sample_jsonl_lines, capsys, monkeypatch
+    ):
+        config = RenderConfig()
+        process_stream(
+            io.StringIO("".join(sample_jsonl_lines)), config, PlainFormatter()
+        )
+        batched = capsys.readouterr().out
+
+        monkeypatch.setattr(stream, "OUTPUT_BATCH_SIZE", 1)
+        process_stream(
+            io.StringIO("".join(sample_jsonl_lines)), config, PlainFormatter()
+        )
+        unbatched = capsys.readouterr().out
+
+        assert batched == unbatched
+        assert "What is 2+2?" in batched
+        assert batched.endswith("\n")
+
+    def test_live_input_writes_through(self, sample_jsonl_lines, capsys):
+        source = _LiveInput(sample_jsonl_lines[:2], capsys)
+        process_stream(source, RenderConfig(), PlainFormatter())
+
+        # The first message must be written before the second line is read
+        assert "SYSTEM (init)" in source.seen_before_read[1]
+
+
+class TestFilterBeforeValidation:
+    def test_hidden_type_is_not_validated(self, capsys, monkeypatch):
+        parsed: list[str] = []
+        real_parse = stream.parse_message
+
+        def spy(data):
+            parsed.append(data["type"])
+            return real_parse(data)
+
+        monkeypatch.setattr(stream, "parse_message", spy)
+        lines = (
+            '{"type": "progress", "data": {"type": "hook_progress"}}\n'
+            '{"type": "user", "message": {"content": "hi"}}\n'
+        )
+        process_stream(io.StringIO(lines), RenderConfig(), PlainFormatter())
+
+        assert parsed == ["user"]
+        assert "hi" in capsys.readouterr().out
+
+    def test_hidden_tool_name_rejects_message(self):
+        data = {
+            "type": "assistant",
+            "message": {
+                "content": [
+                    {"type": "text", "text": "running"},
+                    {"type": "tool_use", "name": "Bash", "input": {}},
+                ]
+            },
+        }
+        config = RenderConfig()
+        assert stream._should_show_data(data, config)
+        config.filters.hidden.add("Bash")
+        assert not stream._should_show_data(data, config)
+        config.filters.shown.add("Bash")
+        assert stream._should_show_data(data, config)
+
+
+class TestDecodeLine:
+    @pytest.mark.parametrize("with_orjson", [True, False])
+    def test_matches_stdlib(self, with_orjson, sample_jsonl_lines, monkeypatch):
+        if not with_orjson:
+            monkeypatch.setattr(stream, "orjson", None)
+        for line in sample_jsonl_lines:
+            assert stream.decode_line(line) == json.loads(line)
+
+    def test_stdlib_only_values_fall_back(self):
+        assert math.isnan(stream.decode_line('{"x": NaN}')["x"])
+        assert stream.decode_line('{"x": "\\ud800"}')["x"] == "\ud800"
+
+    def test_invalid_json_raises_stdlib_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            stream.decode_line("{not json")
@@ -0,0 +1,67 @@
+"""Tests for -n/--lines tail selection in process_stream."""
+
+import io
+import json
+
+import pytest
+
+from claude_logs.formatters import PlainFormatter
+from claude_logs.models import FilterConfig, RenderConfig
+from claude_logs.stream import process_stream, tail_offset
+
+
+def _user_line(text: str) -> str:
+    return json.dumps({"type": "user", "message": {"content": text}}) + "\n"
+
+
+class TestTailOffset:
+    @pytest.mark.parametrize(
+        "data",
+        ["a\nb\nc\n", "a\nb\nc", "a\n\nb\n", "\n\n\n", "x"],
+    )
+    @pytest.mark.parametrize("n", [1, 2, 5])
+    def test_matches_readlines(self, tmp_path, data, n):
+        path = tmp_path / "f.jsonl"
+        path.write_text(data)
+        expected = io.StringIO(data).readlines()
+
+        with open(path) as f:
+            offset, before = tail_offset(f, n, count_lines=True)
+            f.seek(offset)
+            assert f.read() == "".join(expected[-n:])
+        assert before == len(expected) - len(expected[-n:])
+
+    def test_empty_file_not_mappable(self, tmp_path):
+        path = tmp_path / "empty.jsonl"
+        path.write_text("")
+        with open(path) as f:
+            assert tail_offset(f, 3, count_lines=False) is None
+
+    def test_in_memory_stream_not_mappable(self):
+        assert tail_offset(io.StringIO("a\n"), 1, count_lines=False) is None
+
+
+class TestProcessStreamTail:
+    def test_file_and_stream_agree(self, tmp_path, capsys):
+        content = "".join(_user_line(f"msg {i}") for i in range(10))
+        path = tmp_path / "s.jsonl"
+        path.write_text(content)
+        config = RenderConfig(filters=FilterConfig(shown={"line-numbers"}))
+
+        with open(path) as f:
+            process_stream(f, config, PlainFormatter(), tail_lines=3)
+        from_file = capsys.readouterr().out
+
+        process_stream(io.StringIO(content), config, PlainFormatter(), tail_lines=3)
+        from_stream = capsys.readouterr().out
+
+        assert from_file == from_stream
+        assert "[8]" in from_file and "msg 7" in from_file
+        assert "msg 6" not in from_file
+
+    def test_stream_shorter_than_tail(self, capsys):
+        content = "".join(_user_line(f"msg {i}") for i in range(2))
+        config = RenderConfig(filters=FilterConfig(shown={"line-numbers"}))
+        process_stream(io.StringIO(content), config, PlainFormatter(), tail_lines=5)
+        out = capsys.readouterr().out
+        assert "[1]" in out and "msg 0" in out and "msg 1" in out
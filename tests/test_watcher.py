@@ -0,0 +1,147 @@
+"""Tests for FileWatcher's incremental reads."""
+
+import io
+import json
+import sys
+
+import pytest
+
+from claude_logs.formatters import PlainFormatter
+from claude_logs.models import RenderConfig
+from claude_logs.watcher import FileWatcher
+
+
+def _user_line(text: str) -> str:
+    data = {"type": "user", "message": {"content": text}}
+    return json.dumps(data, ensure_ascii=False) + "\n"
+
+
+@pytest.fixture
+def watcher():
+    return FileWatcher(RenderConfig(), PlainFormatter(), show_filename=False)
+
+
+class TestProcessNewLines:
+    def test_partial_line_waits_for_newline(self, watcher, tmp_path, capsys):
+        path = tmp_path / "s.jsonl"
+        line = _user_line("hello there")
+        path.write_text(_user_line("first") + line[:10])
+
+        watcher.process_new_lines(path)
+        captured = capsys.readouterr()
+        assert "first" in captured.out
+        assert "invalid JSON" not in captured.err
+
+        with open(path, "a") as f:
+            f.write(line[10:])
+        watcher.process_new_lines(path)
+        captured = capsys.readouterr()
+        assert "hello there" in captured.out
+        assert "first" not in captured.out
+        assert captured.err == ""
+        assert watcher.file_positions[path] == path.stat().st_size
+
+    def test_batch_written_at_once(self, watcher, tmp_path, monkeypatch):
+        writes: list[str] = []
+
+        class Recorder(io.StringIO):
+            def write(self, text):
+                writes.append(text)
+                return super().write(text)
+
+        monkeypatch.setattr(sys, "stdout", Recorder())
+        path = tmp_path / "s.jsonl"
+        path.write_text("".join(_user_line(f"msg {i}") for i in range(5)))
+
+        watcher.process_new_lines(path)
+
+        assert len(writes) == 1
+        assert all(f"msg {i}" in writes[0] for i in range(5))
+
+    def test_multibyte_text(self, watcher, tmp_path, capsys):
+        path = tmp_path / "s.jsonl"
+        path.write_text(_user_line("café"), encoding="utf-8")
+        watcher.process_new_lines(path)
+        assert "café" in capsys.readouterr().out
+
+
+class TestProcessTailLines:
+    def test_last_n_lines(self, watcher, tmp_path, capsys):
+        path = tmp_path / "s.jsonl"
+        path.write_text("".join(_user_line(f"msg {i}") for i in range(10)))
+
+        watcher.process_tail_lines(path, 3)
+
+        out = capsys.readouterr().out
+        assert "msg 6" not in out
+        assert all(f"msg {i}" in out for i in (7, 8, 9))
+        assert watcher.file_positions[path] == path.stat().st_size
+
+    def test_unterminated_last_record_shown(self, watcher, tmp_path, capsys):
+        path = tmp_path / "s.jsonl"
+        lines = [_user_line(f"msg {i}") for i in range(5)]
+        path.write_text("".join(lines).rstrip("\n"))
+
+        watcher.process_tail_lines(path, 3)
+
+        out = capsys.readouterr().out
+        assert "msg 1" not in out
+        assert all(f"msg {i}" in out for i in (2, 3, 4))
+        assert watcher.file_positions[path] == path.stat().st_size
+
+        # The writer's newline and next record are read without a warning
+        with open(path, "a") as f:
+            f.write("\n" + _user_line("msg 5"))
+        watcher.process_new_lines(path)
+        captured = capsys.readouterr()
+        assert "msg 5" in captured.out
+        assert "msg 4" not in captured.out
+        assert "warning" not in captured.err
+
+    def test_partial_last_line_read_once_complete(self, watcher, tmp_path, capsys):
+        path = tmp_path / "s.jsonl"
+        line = _user_line("finished later")
+        half = len(line) // 2
+        path.write_text(_user_line("first") + line[:half])
+
+        watcher.process_tail_lines(path, 3)
+        with open(path, "a") as f:
+            f.write(line[half:])
+        watcher.process_new_lines(path)
+
+        captured = capsys.readouterr()
+        assert "first" in captured.out
+        assert "finished later" in captured.out
+        assert "warning" not in captured.err
+        assert watcher.file_positions[path] == path.stat().st_size
+
+    def test_empty_file(self, watcher, tmp_path, capsys):
+        path = tmp_path / "s.jsonl"
+        path.write_text("")
+
+        watcher.process_tail_lines(path, 3)
+
+        assert capsys.readouterr().out == ""
+        assert watcher.file_positions[path] == 0
+
+
+class TestGetInitialFiles:
+    @pytest.fixture
+    def tree(self, tmp_path):
+        (tmp_path / "a.jsonl").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+        (tmp_path / "proj").mkdir()
+        (tmp_path / "proj" / "b.jsonl").write_text("")
+        return tmp_path
+
+    def test_recursive_matches_rglob(self, watcher, tree):
+        found = watcher.get_initial_files(tree, recursive=True)
+        assert sorted(found) == sorted(tree.rglob("*.jsonl"))
+
+    def test_non_recursive_matches_glob(self, watcher, tree):
+        found = watcher.get_initial_files(tree, recursive=False)
+        assert sorted(found) == sorted(tree.glob("*.jsonl"))
+        assert found == [tree / "a.jsonl"]
+
+    def test_file_path_returned_as_is(self, watcher, tree):
+        assert watcher.get_initial_files(tree / "a.jsonl") == [tree / "a.jsonl"]